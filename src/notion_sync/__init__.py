@@ -33,5 +33,6 @@ DEFAULT_CONFIG = {
     "auto_sync": False,
     "dark_mode": "system",  # "light", "dark", "system"
     "export_format": "markdown",
-    "backup_location": "~/Documents/Notion Backups"
+    "backup_location": "~/Documents/Notion Backups",
+    "file_watch_mode": "auto"  # "auto"（系统事件，缺少 watchdog 时轮询）, "polling"（网络盘等）
 }
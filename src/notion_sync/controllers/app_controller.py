@@ -33,7 +33,7 @@ class AppController(BaseController):
         self.settings_manager = SettingsManager(config_manager)
 
         # Initialize sync bridge (统一管理所有同步相关服务)
-        self.sync_bridge = SyncBridge(config_manager)
+        self.sync_bridge = SyncBridge(config_manager, self.database_manager)
 
         # Initialize task manager
         from notion_sync.services.task_manager import TaskManager
@@ -63,6 +63,7 @@ class AppController(BaseController):
         # Sync bridge signals
         self.sync_bridge.sync_status_changed.connect(self._on_sync_status_changed)
         self.sync_bridge.connection_status_changed.connect(self._on_connection_status_changed)
+        self.sync_bridge.workspace_loaded.connect(self._on_workspace_loaded)
     
     def _load_initial_state(self) -> None:
         """加载初始应用状态。"""
@@ -323,6 +324,9 @@ class AppController(BaseController):
         # Stop file watching
         self.file_manager.stop_watching()
 
+        # 写入尚未保存的任务变更
+        self.task_manager.flush()
+
         # 清理同步桥接器
         self.sync_bridge.cleanup()
     
@@ -343,12 +347,11 @@ class AppController(BaseController):
 
     def _on_connection_status_changed(self, connected: bool) -> None:
         """处理连接状态变化。"""
-        workspace_name = ""
-        if connected and self.sync_bridge.notion_client:
-            workspace_info = self.sync_bridge.get_notion_workspace_info()
-            workspace_name = workspace_info.get("name", "")
+        if connected:
+            # 在后台预热工作区缓存，避免连接时阻塞界面
+            self.sync_bridge.load_notion_workspace_async()
 
-        self.main_window.set_connection_status(connected, workspace_name)
+        self.main_window.set_connection_status(connected)
         if connected:
             self.main_window.set_status("已连接到云端服务")
         else:
@@ -437,9 +440,15 @@ class AppController(BaseController):
 
         self.main_window.set_status("正在加载工作区...")
 
-        # 加载工作区数据
+        # 加载工作区数据；成功时由 workspace_loaded 信号更新界面
         workspace_data = self.sync_bridge.get_notion_workspace_info()
 
+        if not workspace_data:
+            print("工作区数据为空")
+            self.main_window.set_status("工作区加载失败")
+
+    def _on_workspace_loaded(self, workspace_data: Dict[str, Any]) -> None:
+        """工作区加载完成（前台或后台预热）后更新界面。"""
         if workspace_data:
             # 转换为 UI 需要的格式
             pages = workspace_data.get("pages", [])
@@ -470,9 +479,6 @@ class AppController(BaseController):
                 self.main_window.sync_view.update_notion_content(ui_data)
 
             self.main_window.set_status("工作区加载完成")
-        else:
-            print("工作区数据为空")
-            self.main_window.set_status("工作区加载失败")
 
     def _on_notion_target_selected(self, parameters: Dict[str, Any]) -> None:
         """处理 Notion 目标选择。"""
@@ -10,7 +10,6 @@ from typing import Optional
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QDir
-from PySide6.QtGui import QIcon
 
 # 将 src 目录添加到 Python 路径
 src_dir = Path(__file__).parent.parent
@@ -21,6 +20,7 @@ from notion_sync.utils.config import ConfigManager
 from notion_sync.utils.logging_config import setup_logging
 from notion_sync.utils.i18n import get_language_manager
 from notion_sync.controllers.app_controller import AppController
+from notion_sync.resources.icons import get_icon, warm_up_icons
 
 
 def setup_application() -> QApplication:
@@ -39,13 +39,14 @@ def setup_application() -> QApplication:
     app.setApplicationDisplayName(APP_NAME)
 
     # 设置应用程序图标
-    icon_path = Path(__file__).parent / "resources" / "icons" / "app_icon.png"
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    app.setWindowIcon(get_icon('app'))
 
     # 设置样式
     app.setStyle("Fusion")  # 使用 Fusion 样式以保持跨平台一致性
 
+    # 在后台线程预先绘制图标，主窗口构建时直接命中缓存
+    warm_up_icons()
+
     return app
 
 
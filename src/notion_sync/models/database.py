@@ -5,8 +5,8 @@ Database models and operations for Notion Sync.
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy import create_engine, Column, String, DateTime, Integer, Text, Boolean, JSON
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import create_engine, Column, String, DateTime, Integer, BigInteger, Text, Boolean, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from PySide6.QtCore import QDir
@@ -101,6 +101,33 @@ class ConflictResolution(Base):
         return f"<ConflictResolution(pattern='{self.pattern}', strategy='{self.resolution_strategy}')>"
 
 
+class NotionChecksumCache(Base):
+    """Database model for cached Notion content checksums."""
+    __tablename__ = 'notion_checksum_cache'
+    
+    notion_id = Column(String(100), primary_key=True)
+    last_edited_time = Column(String(50), nullable=False)
+    checksum = Column(String(64), nullable=False)
+    algorithm = Column(String(20), nullable=False)
+    
+    def __repr__(self):
+        return f"<NotionChecksumCache(notion_id='{self.notion_id}')>"
+
+
+class LocalChecksumCache(Base):
+    """Database model for cached local file checksums."""
+    __tablename__ = 'local_checksum_cache'
+    
+    local_path = Column(String(500), primary_key=True)
+    mtime_ns = Column(BigInteger, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    checksum = Column(String(64), nullable=False)
+    algorithm = Column(String(20), nullable=False)
+    
+    def __repr__(self):
+        return f"<LocalChecksumCache(local_path='{self.local_path}')>"
+
+
 class DatabaseManager(LoggerMixin):
     """Manages database operations for the application."""
     
@@ -304,6 +331,75 @@ class DatabaseManager(LoggerMixin):
             self.logger.error(f"Failed to get all settings: {e}")
             return {}
     
+    # Checksum Cache Operations
+    def get_notion_checksums(self, algorithm: str) -> Dict[str, Tuple[str, str]]:
+        """Get cached Notion checksums as notion_id -> (last_edited_time, checksum)."""
+        try:
+            with self.get_session() as session:
+                entries = session.query(NotionChecksumCache).filter_by(algorithm=algorithm).all()
+                return {e.notion_id: (e.last_edited_time, e.checksum) for e in entries}
+        except Exception as e:
+            self.logger.error(f"Failed to get Notion checksum cache: {e}")
+            return {}
+    
+    def save_notion_checksums(self, entries: Dict[str, Tuple[str, str]], algorithm: str) -> bool:
+        """Insert or update cached Notion checksums."""
+        try:
+            with self.get_session() as session:
+                for notion_id, (last_edited_time, checksum) in entries.items():
+                    session.merge(NotionChecksumCache(
+                        notion_id=notion_id,
+                        last_edited_time=last_edited_time,
+                        checksum=checksum,
+                        algorithm=algorithm
+                    ))
+                session.commit()
+                return True
+        except Exception as e:
+            self.logger.error(f"Failed to save Notion checksum cache: {e}")
+            return False
+    
+    def delete_notion_checksums(self, notion_ids: List[str]) -> bool:
+        """Remove cached Notion checksums."""
+        try:
+            with self.get_session() as session:
+                (session.query(NotionChecksumCache)
+                 .filter(NotionChecksumCache.notion_id.in_(notion_ids))
+                 .delete(synchronize_session=False))
+                session.commit()
+                return True
+        except Exception as e:
+            self.logger.error(f"Failed to delete Notion checksum cache entries: {e}")
+            return False
+    
+    def get_local_checksums(self, algorithm: str) -> Dict[str, Tuple[int, int, str]]:
+        """Get cached local checksums as local_path -> (mtime_ns, size, checksum)."""
+        try:
+            with self.get_session() as session:
+                entries = session.query(LocalChecksumCache).filter_by(algorithm=algorithm).all()
+                return {e.local_path: (e.mtime_ns, e.size, e.checksum) for e in entries}
+        except Exception as e:
+            self.logger.error(f"Failed to get local checksum cache: {e}")
+            return {}
+    
+    def save_local_checksums(self, entries: Dict[str, Tuple[int, int, str]], algorithm: str) -> bool:
+        """Insert or update cached local checksums."""
+        try:
+            with self.get_session() as session:
+                for local_path, (mtime_ns, size, checksum) in entries.items():
+                    session.merge(LocalChecksumCache(
+                        local_path=local_path,
+                        mtime_ns=mtime_ns,
+                        size=size,
+                        checksum=checksum,
+                        algorithm=algorithm
+                    ))
+                session.commit()
+                return True
+        except Exception as e:
+            self.logger.error(f"Failed to save local checksum cache: {e}")
+            return False
+    
     # Conflict Resolution Operations
     def add_conflict_resolution(self, pattern: str, strategy: str, auto_apply: bool = False) -> bool:
         """Add a conflict resolution rule."""
@@ -16,6 +16,7 @@ from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreat
 
 from notion_sync.models.base import BaseModel
 from notion_sync import SUPPORTED_FORMATS
+from notion_sync.utils.checksum import new_checksum_hasher
 
 
 class FileWatcher(FileSystemEventHandler):
@@ -87,9 +88,12 @@ class FileInfo:
         if not self.path.exists() or self.is_directory:
             return ""
         
-        hasher = hashlib.md5()
         with open(self.path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the C hasher reads the file directly
+                return hashlib.file_digest(f, new_checksum_hasher).hexdigest()
+            hasher = new_checksum_hasher()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 hasher.update(chunk)
         return hasher.hexdigest()
     
@@ -3,8 +3,9 @@ Notion API client with rate limiting and error handling.
 """
 
 import asyncio
+import random
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 import aiohttp
 from asyncio_throttle import Throttler
 
@@ -22,6 +23,10 @@ class NotionAPIError(Exception):
         self.error_code = error_code
 
 
+# Status codes worth retrying: conflicts, rate limits and gateway hiccups
+_RETRYABLE_STATUS_CODES = frozenset({409, 429, 502, 503, 504})
+
+
 class NotionClient(BaseModel):
     """Notion API client with authentication and rate limiting."""
     
@@ -35,9 +40,19 @@ class NotionClient(BaseModel):
         # Rate limiting: 3 requests per second
         self.throttler = Throttler(rate_limit=3, period=1.0)
         
+        # Exponential backoff for transient failures
+        self.retry_attempts = 3
+        self._retry_base_delay = 0.5
+        self._retry_max_delay = 8.0
+        
         # Session for connection pooling
         self._session: Optional[aiohttp.ClientSession] = None
         
+        # Bounds concurrent fetches issued by the batch helpers
+        self._max_inflight_requests = 3
+        # Keyed by the loop that created it: each sync run uses a fresh asyncio.run loop
+        self._inflight_sem: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+        
         # Cache for frequently accessed data
         self._pages_cache: Dict[str, Dict] = {}
         self._databases_cache: Dict[str, Dict] = {}
@@ -50,6 +65,13 @@ class NotionClient(BaseModel):
             self._session = aiohttp.ClientSession(timeout=timeout)
         return self._session
     
+    def _get_inflight_semaphore(self) -> asyncio.Semaphore:
+        """Get the running loop's semaphore bounding batched fetches."""
+        loop = asyncio.get_running_loop()
+        if self._inflight_sem is None or self._inflight_sem[0] is not loop:
+            self._inflight_sem = (loop, asyncio.Semaphore(self._max_inflight_requests))
+        return self._inflight_sem[1]
+    
     async def close(self) -> None:
         """Close the HTTP session."""
         if self._session and not self._session.closed:
@@ -67,7 +89,7 @@ class NotionClient(BaseModel):
     async def _make_request(self, method: str, endpoint: str, 
                           data: Optional[Dict] = None, 
                           params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make a rate-limited API request."""
+        """Make a rate-limited API request, retrying transient failures."""
         if not self.auth_manager.is_authenticated:
             raise NotionAPIError("Not authenticated")
         
@@ -76,6 +98,26 @@ class NotionClient(BaseModel):
             if not await self.auth_manager.refresh_access_token():
                 raise NotionAPIError("Failed to refresh access token")
         
+        attempt = 0
+        while True:
+            try:
+                return await self._send_request(method, endpoint, data, params)
+            except NotionAPIError as e:
+                if e.status_code not in _RETRYABLE_STATUS_CODES or attempt >= self.retry_attempts:
+                    raise
+                delay = min(self._retry_max_delay, self._retry_base_delay * 2 ** attempt)
+                delay += random.uniform(0, 0.25)
+                attempt += 1
+                self.logger.warning(
+                    f"Transient error {e.status_code} on {method} {endpoint}, "
+                    f"retry {attempt}/{self.retry_attempts} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+    
+    async def _send_request(self, method: str, endpoint: str,
+                            data: Optional[Dict] = None,
+                            params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Send a single throttled API request."""
         # Apply rate limiting
         async with self.throttler:
             session = await self._get_session()
@@ -182,6 +224,27 @@ class NotionClient(BaseModel):
             self._set_error(f"Failed to get database {database_id}: {str(e)}")
             return None
     
+    async def _gather_by_id(self, fetch, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch objects concurrently, requesting each distinct id only once."""
+        unique_ids = list(dict.fromkeys(ids))
+        sem = self._get_inflight_semaphore()
+        
+        async def fetch_one(object_id: str) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await fetch(object_id)
+        
+        results = await asyncio.gather(*(fetch_one(i) for i in unique_ids))
+        by_id = dict(zip(unique_ids, results))
+        return [by_id[i] for i in ids]
+    
+    async def get_pages(self, page_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get several pages by ID, in the order requested."""
+        return await self._gather_by_id(self.get_page, page_ids)
+    
+    async def get_databases(self, database_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get several databases by ID, in the order requested."""
+        return await self._gather_by_id(self.get_database, database_ids)
+    
     async def query_database(self, database_id: str, 
                            filter_conditions: Optional[Dict] = None,
                            sorts: Optional[List[Dict]] = None,
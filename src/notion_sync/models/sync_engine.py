@@ -3,16 +3,74 @@
 """
 
 import asyncio
-import hashlib
+import itertools
+import json
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from enum import Enum
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 from notion_sync.models.base import SyncableModel
 from notion_sync.models.notion_client import NotionClient
 from notion_sync.models.file_system import FileManager, FileInfo
 from notion_sync.models.database import DatabaseManager, SyncRecord
+from notion_sync.utils.checksum import CHECKSUM_ALGORITHM, fast_hash, new_checksum_hasher
+
+
+# ISO 8601 时间解析：优先 ciso8601；Python 3.11+ 的 fromisoformat 可直接解析 "Z"
+if ciso8601 is not None:
+    _PARSE_ISO = ciso8601.parse_datetime
+elif sys.version_info >= (3, 11):
+    _PARSE_ISO = datetime.fromisoformat
+else:
+    def _PARSE_ISO(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _checksum_blocks(blocks: List[Dict[str, Any]]) -> str:
+    """逐块以规范 JSON 喂入哈希器计算校验和，避免拼接整页字符串。"""
+    hasher = new_checksum_hasher()
+    for block in blocks:
+        hasher.update(json.dumps(
+            block, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+# 块类型 -> Markdown 行模板；未列出的块类型被忽略
+_MARKDOWN_BLOCK_FORMATS = {
+    "paragraph": "{}\n",
+    "heading_1": "# {}\n",
+    "heading_2": "## {}\n",
+    "heading_3": "### {}\n",
+    "bulleted_list_item": "- {}",
+    "numbered_list_item": "1. {}",
+    "quote": "> {}\n",
+}
+
+
+def _render_blocks(blocks: List[Dict[str, Any]], suffix: str) -> bytes:
+    """按本地文件类型渲染 Notion 块：.json 保留原始块，其余输出 Markdown。"""
+    if suffix == ".json":
+        return json.dumps(blocks, ensure_ascii=False, indent=2).encode("utf-8")
+    
+    lines = []
+    for block in blocks:
+        block_type = block.get("type", "")
+        data = block.get(block_type, {})
+        text = "".join(t.get("plain_text", "") for t in data.get("rich_text", []))
+        if block_type == "code":
+            lines.append(f"```{data.get('language', '')}\n{text}\n```\n")
+        elif block_type in _MARKDOWN_BLOCK_FORMATS:
+            lines.append(_MARKDOWN_BLOCK_FORMATS[block_type].format(text))
+    return "\n".join(lines).encode("utf-8")
 
 
 class ConflictType(Enum):
@@ -25,6 +83,48 @@ class ConflictType(Enum):
     NOTION_DELETED = "notion_deleted"
 
 
+def _classify_conflict(local_exists: bool, notion_exists: bool,
+                       local_changed: bool, notion_changed: bool) -> ConflictType:
+    """根据存在性与变更状态判定冲突类型（仅用于构建查找表）。"""
+    if not local_exists and not notion_exists:
+        return ConflictType.NO_CONFLICT
+    if not local_exists:
+        return ConflictType.LOCAL_DELETED
+    if not notion_exists:
+        return ConflictType.NOTION_DELETED
+    if local_changed and notion_changed:
+        return ConflictType.BOTH_MODIFIED
+    if local_changed:
+        return ConflictType.LOCAL_NEWER
+    if notion_changed:
+        return ConflictType.NOTION_NEWER
+    return ConflictType.NO_CONFLICT
+
+
+# (local_exists, notion_exists, local_changed, notion_changed) -> 冲突类型
+_CONFLICT_TABLE: Dict[Tuple[bool, bool, bool, bool], ConflictType] = {
+    flags: _classify_conflict(*flags)
+    for flags in itertools.product((False, True), repeat=4)
+}
+
+# 首次同步: (local_exists, notion_exists) -> 冲突类型
+_FIRST_SYNC_TABLE: Dict[Tuple[bool, bool], ConflictType] = {
+    (True, True): ConflictType.BOTH_MODIFIED,
+    (True, False): ConflictType.LOCAL_NEWER,
+    (False, True): ConflictType.NOTION_NEWER,
+    (False, False): ConflictType.NO_CONFLICT,
+}
+
+# 冲突类型 -> (操作类型, 同步方向)；NO_CONFLICT 不产生操作
+_OP_MAP: Dict[ConflictType, Tuple[str, str]] = {
+    ConflictType.LOCAL_NEWER: ("update", "local_to_notion"),
+    ConflictType.NOTION_NEWER: ("update", "notion_to_local"),
+    ConflictType.LOCAL_DELETED: ("delete", "local_to_notion"),
+    ConflictType.NOTION_DELETED: ("delete", "notion_to_local"),
+    ConflictType.BOTH_MODIFIED: ("update", "bidirectional"),
+}
+
+
 class ConflictResolution(Enum):
     """冲突解决策略枚举。"""
     ASK_USER = "ask_user"
@@ -34,9 +134,36 @@ class ConflictResolution(Enum):
     SKIP = "skip"
 
 
+class _StatusColumn:
+    """同步操作状态的列式存储；各状态的计数只随列中的值变化而更新。"""
+    
+    __slots__ = ("values", "counts")
+    
+    def __init__(self):
+        self.values: List[str] = []
+        self.counts: Counter = Counter()
+    
+    def append(self, status: str) -> int:
+        """追加一个状态，返回其下标。"""
+        self.values.append(status)
+        self.counts[status] += 1
+        return len(self.values) - 1
+    
+    def set(self, index: int, status: str) -> None:
+        """修改下标处的状态。"""
+        self.counts[self.values[index]] -= 1
+        self.counts[status] += 1
+        self.values[index] = status
+
+
 class SyncOperation:
     """同步操作数据类。"""
     
+    # 使用 __slots__ 省去每个实例的 __dict__
+    __slots__ = ("operation_type", "local_path", "notion_id", "direction",
+                 "conflict_type", "resolution", "error_message",
+                 "_status", "_status_column", "_index")
+    
     def __init__(self, operation_type: str, local_path: str, notion_id: str,
                  direction: str, conflict_type: ConflictType = ConflictType.NO_CONFLICT):
         self.operation_type = operation_type  # create, update, delete
@@ -45,8 +172,62 @@ class SyncOperation:
         self.direction = direction  # local_to_notion, notion_to_local, bidirectional
         self.conflict_type = conflict_type
         self.resolution: Optional[ConflictResolution] = None
-        self.status = "pending"  # pending, in_progress, completed, failed
         self.error_message: Optional[str] = None
+        
+        # 加入引擎后状态改存在引擎的状态列中，列是唯一的数据来源
+        self._status = "pending"
+        self._status_column: Optional[_StatusColumn] = None
+        self._index = -1
+    
+    @property
+    def status(self) -> str:
+        """操作状态: pending, in_progress, completed, failed。"""
+        if self._status_column is not None:
+            return self._status_column.values[self._index]
+        return self._status
+    
+    @status.setter
+    def status(self, value: str) -> None:
+        if self._status_column is not None:
+            self._status_column.set(self._index, value)
+        else:
+            self._status = value
+    
+    def _attach(self, status_column: _StatusColumn) -> None:
+        """把状态移入引擎的状态列。"""
+        self._index = status_column.append(self._status)
+        self._status_column = status_column
+
+
+class _RateLimiter:
+    """按固定间隔放行的速率限制器，平滑突发请求。"""
+    
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        # 锁在运行中的事件循环里按需创建；换了循环（每次 asyncio.run）就重建
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next = 0.0
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """获取绑定到当前事件循环的锁。"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            # 不同循环的 loop.time() 不可比较
+            self._next = 0.0
+        return self._lock
+    
+    async def acquire(self) -> None:
+        """等待直到允许下一次调用。"""
+        async with self._get_lock():
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if now < self._next:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self._interval
 
 
 class SyncEngine(SyncableModel):
@@ -65,9 +246,29 @@ class SyncEngine(SyncableModel):
         self.max_concurrent_operations = 3
         self.retry_attempts = 3
         
+        # 并发信号量只限制在途数量，另用速率限制器把操作分发控制在 Notion 的 ~3 rps 之下
+        self._rate_limiter = _RateLimiter(3.0)
+        
         # 当前同步状态
         self._sync_operations: List[SyncOperation] = []
         self._current_operation_index = 0
+        self._skipped_writes = 0
+        
+        # _sync_operations 的列式投影，供按方向/冲突类型/状态筛选使用；
+        # 状态列同时是操作状态的存储，状态计数由它维护
+        self._status_column = _StatusColumn()
+        self._soa: Dict[str, list] = self._new_soa()
+        
+        # Notion 内容校验和缓存: notion_id -> (last_edited_time, checksum)
+        self._notion_checksum_cache: Dict[str, Tuple[str, str]] = \
+            self.database_manager.get_notion_checksums(CHECKSUM_ALGORITHM)
+        self._dirty_notion_checksums: Set[str] = set()
+        self._notion_checksum_tasks: Dict[Tuple[str, str], asyncio.Future] = {}
+        
+        # 本地文件校验和缓存: local_path -> (st_mtime_ns, st_size, checksum)
+        self._local_checksum_cache: Dict[str, Tuple[int, int, str]] = \
+            self.database_manager.get_local_checksums(CHECKSUM_ALGORITHM)
+        self._dirty_local_checksums: Set[str] = set()
     
     async def sync(self) -> bool:
         """执行同步操作。"""
@@ -75,6 +276,13 @@ class SyncEngine(SyncableModel):
             self._set_sync_state(True)
             self.logger.info("开始双向同步")
             
+            # 重置上一次同步的操作和统计
+            self._sync_operations = []
+            self._skipped_writes = 0
+            self._status_column = _StatusColumn()
+            self._soa = self._new_soa()
+            self._notion_checksum_tasks = {}
+            
             # 获取所有同步记录
             sync_records = self.database_manager.get_all_sync_records()
             
@@ -82,23 +290,18 @@ class SyncEngine(SyncableModel):
                 self.logger.info("没有配置的同步对")
                 return True
             
-            # 分析每个同步对的状态
-            total_operations = 0
-            for record in sync_records:
-                operations = await self._analyze_sync_record(record)
-                self._sync_operations.extend(operations)
-                total_operations += len(operations)
+            # 一次性并发预取所有页面元数据，相同的 Notion ID 只获取一次
+            notion_pages = await self._prefetch_notion_pages(list(dict.fromkeys(
+                r.notion_id for r in sync_records if r.notion_type == "page"
+            )))
+            
+            # 分析与执行组成流水线，分析出的操作立即交给执行工作协程
+            success = await self._run_sync_pipeline(sync_records, notion_pages)
             
             if not self._sync_operations:
                 self.logger.info("没有需要同步的内容")
                 return True
             
-            # 处理冲突
-            await self._resolve_conflicts()
-            
-            # 执行同步操作
-            success = await self._execute_sync_operations()
-            
             self.logger.info(f"同步完成，成功: {success}")
             return success
             
@@ -107,9 +310,19 @@ class SyncEngine(SyncableModel):
             self._set_error(f"同步失败: {str(e)}")
             return False
         finally:
+            self._flush_checksum_caches()
             self._set_sync_state(False)
     
-    async def _analyze_sync_record(self, record: SyncRecord) -> List[SyncOperation]:
+    async def _prefetch_notion_pages(self, notion_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """并发预取 Notion 页面元数据，供分析阶段直接查表。"""
+        if not notion_ids:
+            return {}
+        pages = await self.notion_client.get_pages(notion_ids)
+        return dict(zip(notion_ids, pages))
+    
+    async def _analyze_sync_record(self, record: SyncRecord,
+                                   notion_pages: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+                                   ) -> List[SyncOperation]:
         """分析同步记录，确定需要的操作。"""
         operations = []
         
@@ -123,7 +336,7 @@ class SyncEngine(SyncableModel):
             if local_exists:
                 file_info = FileInfo(local_path)
                 local_modified = file_info.modified_time
-                local_checksum = file_info.get_checksum()
+                local_checksum = await self._get_cached_local_checksum(file_info)
             
             # 获取 Notion 内容信息
             notion_exists = False
@@ -131,14 +344,17 @@ class SyncEngine(SyncableModel):
             notion_checksum = None
             
             if record.notion_type == "page":
-                notion_page = await self.notion_client.get_page(record.notion_id)
+                if notion_pages is not None and record.notion_id in notion_pages:
+                    notion_page = notion_pages[record.notion_id]
+                else:
+                    notion_page = await self.notion_client.get_page(record.notion_id)
                 if notion_page:
                     notion_exists = True
-                    notion_modified = datetime.fromisoformat(
-                        notion_page["last_edited_time"].replace("Z", "+00:00")
+                    notion_modified = _PARSE_ISO(notion_page["last_edited_time"])
+                    # 计算 Notion 内容的校验和（未编辑的页面复用缓存）
+                    notion_checksum = await self._get_cached_notion_checksum(
+                        record.notion_id, notion_page["last_edited_time"]
                     )
-                    # 计算 Notion 内容的校验和
-                    notion_checksum = await self._get_notion_content_checksum(record.notion_id)
             
             # 确定冲突类型
             conflict_type = self._detect_conflict(
@@ -162,64 +378,26 @@ class SyncEngine(SyncableModel):
                         notion_modified: Optional[datetime], notion_checksum: Optional[str],
                         record: SyncRecord) -> ConflictType:
         """检测冲突类型。"""
-        
         # 如果没有上次同步时间，认为是首次同步
         if not record.last_sync_time:
-            if local_exists and notion_exists:
-                return ConflictType.BOTH_MODIFIED
-            elif local_exists:
-                return ConflictType.LOCAL_NEWER
-            elif notion_exists:
-                return ConflictType.NOTION_NEWER
-            else:
-                return ConflictType.NO_CONFLICT
-        
-        # 检查是否有删除
-        if not local_exists and not notion_exists:
-            return ConflictType.NO_CONFLICT
-        elif not local_exists:
-            return ConflictType.LOCAL_DELETED
-        elif not notion_exists:
-            return ConflictType.NOTION_DELETED
+            return _FIRST_SYNC_TABLE[(local_exists, notion_exists)]
         
         # 检查内容是否变更
-        local_changed = (local_modified and local_modified > record.last_sync_time) or \
+        local_changed = bool(local_modified and local_modified > record.last_sync_time) or \
                        (local_checksum != record.local_checksum)
-        notion_changed = (notion_modified and notion_modified > record.last_sync_time) or \
+        notion_changed = bool(notion_modified and notion_modified > record.last_sync_time) or \
                         (notion_checksum != record.notion_checksum)
         
-        if local_changed and notion_changed:
-            return ConflictType.BOTH_MODIFIED
-        elif local_changed:
-            return ConflictType.LOCAL_NEWER
-        elif notion_changed:
-            return ConflictType.NOTION_NEWER
-        else:
-            return ConflictType.NO_CONFLICT
+        return _CONFLICT_TABLE[(local_exists, notion_exists, local_changed, notion_changed)]
     
     def _create_sync_operation(self, record: SyncRecord, conflict_type: ConflictType) -> Optional[SyncOperation]:
         """根据冲突类型创建同步操作。"""
-        
-        if conflict_type == ConflictType.NO_CONFLICT:
-            return None
-        
         # 确定操作类型和方向
-        if conflict_type == ConflictType.LOCAL_NEWER:
-            operation_type = "update"
-            direction = "local_to_notion"
-        elif conflict_type == ConflictType.NOTION_NEWER:
-            operation_type = "update"
-            direction = "notion_to_local"
-        elif conflict_type == ConflictType.LOCAL_DELETED:
-            operation_type = "delete"
-            direction = "local_to_notion"
-        elif conflict_type == ConflictType.NOTION_DELETED:
-            operation_type = "delete"
-            direction = "notion_to_local"
-        else:  # BOTH_MODIFIED
-            operation_type = "update"
-            direction = "bidirectional"
+        entry = _OP_MAP.get(conflict_type)
+        if entry is None:
+            return None
         
+        operation_type, direction = entry
         return SyncOperation(
             operation_type=operation_type,
             local_path=record.local_path,
@@ -228,50 +406,104 @@ class SyncEngine(SyncableModel):
             conflict_type=conflict_type
         )
     
-    async def _resolve_conflicts(self) -> None:
-        """解决冲突。"""
-        for operation in self._sync_operations:
-            if operation.conflict_type == ConflictType.BOTH_MODIFIED:
-                # 发出冲突检测信号，让 UI 处理
-                conflict_data = {
-                    "local_path": operation.local_path,
-                    "notion_id": operation.notion_id,
-                    "conflict_type": operation.conflict_type.value,
-                    "operation": operation
-                }
-                self.conflict_detected.emit(conflict_data)
-                
-                # 如果没有用户选择，使用默认策略
-                if operation.resolution is None:
-                    operation.resolution = self.default_resolution
-    
-    async def _execute_sync_operations(self) -> bool:
-        """执行同步操作。"""
-        total_operations = len(self._sync_operations)
-        completed_operations = 0
-        
-        # 使用信号量限制并发操作数
-        semaphore = asyncio.Semaphore(self.max_concurrent_operations)
+    async def _run_sync_pipeline(self, sync_records: List[SyncRecord],
+                                 notion_pages: Dict[str, Optional[Dict[str, Any]]]) -> bool:
+        """分析与执行流水线：分析协程经有界队列把操作交给执行协程。"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_operations * 4)
+        records = iter(sync_records)
         
-        async def execute_operation(operation: SyncOperation) -> bool:
-            async with semaphore:
-                return await self._execute_single_operation(operation)
+        async def analyze_worker() -> None:
+            # 各分析协程共享同一个记录迭代器
+            for record in records:
+                for operation in await self._analyze_sync_record(record, notion_pages):
+                    self._add_operations([operation])
+                    self._resolve_conflict(operation)
+                    await queue.put(operation)
         
-        # 并发执行操作
-        tasks = [execute_operation(op) for op in self._sync_operations]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        workers = [asyncio.create_task(self._worker(queue))
+                   for _ in range(self.max_concurrent_operations)]
+        try:
+            await asyncio.gather(*(analyze_worker()
+                                   for _ in range(self.max_concurrent_operations)))
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
         
         # 统计结果
-        success_count = sum(1 for result in results if result is True)
+        total_operations = len(self._sync_operations)
+        success_count = self._status_column.counts["completed"]
         
-        # 更新进度
-        self._emit_progress(100, f"同步完成: {success_count}/{total_operations} 成功")
+        if total_operations:
+            self._emit_progress(100, f"同步完成: {success_count}/{total_operations} 成功")
         
         return success_count == total_operations
     
+    def _resolve_conflict(self, operation: SyncOperation) -> None:
+        """解决冲突。"""
+        if operation.conflict_type != ConflictType.BOTH_MODIFIED:
+            return
+        
+        # 发出冲突检测信号，让 UI 处理
+        conflict_data = {
+            "local_path": operation.local_path,
+            "notion_id": operation.notion_id,
+            "conflict_type": operation.conflict_type.value,
+            "operation": operation
+        }
+        self.conflict_detected.emit(conflict_data)
+        
+        # 如果没有用户选择，使用默认策略
+        if operation.resolution is None:
+            operation.resolution = self.default_resolution
+    
+    def _new_soa(self) -> Dict[str, list]:
+        """创建空的列式投影，状态列与 _status_column 共用同一个列表。"""
+        return {"direction": [], "conflict_type": [], "status": self._status_column.values}
+    
+    def _add_operations(self, operations: List[SyncOperation]) -> None:
+        """添加同步操作，并同步更新列式投影。"""
+        self._sync_operations.extend(operations)
+        self._soa["direction"].extend(op.direction for op in operations)
+        self._soa["conflict_type"].extend(op.conflict_type for op in operations)
+        for op in operations:
+            op._attach(self._status_column)
+    
+    def _select_operations(self, column: str, value: Any) -> List[SyncOperation]:
+        """按列式投影中的某一列筛选同步操作。"""
+        operations = self._sync_operations
+        return [operations[i] for i, v in enumerate(self._soa[column]) if v == value]
+    
+    def get_operations_by_direction(self, direction: str) -> List[SyncOperation]:
+        """获取指定同步方向的操作。"""
+        return self._select_operations("direction", direction)
+    
+    def get_operations_by_conflict_type(self, conflict_type: ConflictType) -> List[SyncOperation]:
+        """获取指定冲突类型的操作。"""
+        return self._select_operations("conflict_type", conflict_type)
+    
+    def get_operations_by_status(self, status: str) -> List[SyncOperation]:
+        """获取指定状态的操作。"""
+        return self._select_operations("status", status)
+    
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """持续从队列中取出操作执行，每完成一个就更新进度。"""
+        while True:
+            operation = await queue.get()
+            try:
+                await self._execute_single_operation(operation)
+                counts = self._status_column.counts
+                done = counts["completed"] + counts["failed"]
+                total = len(self._sync_operations)
+                self._emit_progress(min(99, done * 100 // total), f"已处理 {done}/{total} 个操作")
+            finally:
+                queue.task_done()
+    
     async def _execute_single_operation(self, operation: SyncOperation) -> bool:
         """执行单个同步操作。"""
         try:
+            await self._rate_limiter.acquire()
             operation.status = "in_progress"
             
             if operation.direction == "local_to_notion":
@@ -298,9 +530,35 @@ class SyncEngine(SyncableModel):
         return True
     
     async def _sync_notion_to_local(self, operation: SyncOperation) -> bool:
-        """同步 Notion 内容到本地。"""
-        # 实现 Notion 到本地的同步逻辑
+        """同步 Notion 内容到本地；内容未变时不触碰文件。"""
         self.logger.info(f"同步 Notion 内容到本地: {operation.notion_id}")
+        blocks = await self.notion_client.get_page_content(operation.notion_id)
+        if not blocks:
+            # 获取失败时 get_page_content 也返回空列表，无法区分时不清空本地文件
+            operation.error_message = "未获取到 Notion 内容，保留本地文件"
+            return False
+        
+        local_path = Path(operation.local_path)
+        content = await asyncio.to_thread(_render_blocks, blocks, local_path.suffix.lower())
+        await self._write_local_if_changed(local_path, content)
+        return True
+    
+    async def _write_local_if_changed(self, local_path: Path, content: bytes) -> bool:
+        """写入本地文件；内容与现有文件一致时跳过写入以保留 mtime。返回是否实际写入。"""
+        new_checksum = fast_hash(content)
+        if local_path.exists():
+            existing_checksum = await self._get_cached_local_checksum(FileInfo(local_path))
+            if existing_checksum == new_checksum:
+                self._skipped_writes += 1
+                self.logger.info(f"内容未变化，跳过写入: {local_path}")
+                return False
+        
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(local_path.write_bytes, content)
+        
+        stat = local_path.stat()
+        self._local_checksum_cache[str(local_path)] = (stat.st_mtime_ns, stat.st_size, new_checksum)
+        self._dirty_local_checksums.add(str(local_path))
         return True
     
     async def _handle_bidirectional_conflict(self, operation: SyncOperation) -> bool:
@@ -323,13 +581,68 @@ class SyncEngine(SyncableModel):
             # 获取页面内容
             blocks = await self.notion_client.get_page_content(notion_id)
             
-            # 将内容转换为字符串并计算校验和
-            content_str = str(blocks)
-            return hashlib.md5(content_str.encode()).hexdigest()
+            # 在线程中计算校验和，避免大页面阻塞事件循环
+            return await asyncio.to_thread(_checksum_blocks, blocks)
         except Exception as e:
             self.logger.error(f"获取 Notion 内容校验和失败: {e}")
             return ""
     
+    async def _get_cached_notion_checksum(self, notion_id: str, last_edited_time: str) -> str:
+        """获取 Notion 内容校验和，页面未编辑时直接使用缓存。"""
+        cached = self._notion_checksum_cache.get(notion_id)
+        if cached and cached[0] == last_edited_time:
+            return cached[1]
+        
+        # 多个同步记录指向同一页面时，共享同一次内容获取与哈希
+        key = (notion_id, last_edited_time)
+        task = self._notion_checksum_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_notion_content_checksum(notion_id))
+            self._notion_checksum_tasks[key] = task
+        
+        checksum = await task
+        if checksum:
+            self._notion_checksum_cache[notion_id] = (last_edited_time, checksum)
+            self._dirty_notion_checksums.add(notion_id)
+        return checksum
+    
+    async def _get_cached_local_checksum(self, file_info: FileInfo) -> str:
+        """获取本地文件校验和，文件未变（mtime 与大小相同）时直接使用缓存。"""
+        stat = file_info.path.stat()
+        key = str(file_info.path)
+        cached = self._local_checksum_cache.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        
+        # 在线程中计算校验和，避免阻塞事件循环
+        checksum = await asyncio.to_thread(file_info.get_checksum)
+        self._local_checksum_cache[key] = (stat.st_mtime_ns, stat.st_size, checksum)
+        self._dirty_local_checksums.add(key)
+        return checksum
+    
+    def _flush_checksum_caches(self) -> None:
+        """持久化校验和缓存，并使本次同步改动过的条目失效。"""
+        touched_ids = {op.notion_id for op in self.get_operations_by_status("completed")}
+        for notion_id in touched_ids:
+            self._notion_checksum_cache.pop(notion_id, None)
+        self._dirty_notion_checksums -= touched_ids
+        
+        if touched_ids:
+            self.database_manager.delete_notion_checksums(list(touched_ids))
+        if self._dirty_notion_checksums:
+            self.database_manager.save_notion_checksums({
+                notion_id: self._notion_checksum_cache[notion_id]
+                for notion_id in self._dirty_notion_checksums
+            }, CHECKSUM_ALGORITHM)
+            self._dirty_notion_checksums.clear()
+        
+        if self._dirty_local_checksums:
+            self.database_manager.save_local_checksums({
+                path: self._local_checksum_cache[path]
+                for path in self._dirty_local_checksums
+            }, CHECKSUM_ALGORITHM)
+            self._dirty_local_checksums.clear()
+    
     def set_conflict_resolution(self, operation: SyncOperation, resolution: ConflictResolution) -> None:
         """设置冲突解决策略。"""
         operation.resolution = resolution
@@ -341,10 +654,8 @@ class SyncEngine(SyncableModel):
             "pending": 0,
             "in_progress": 0,
             "completed": 0,
-            "failed": 0
+            "failed": 0,
+            "skipped": self._skipped_writes
         }
-        
-        for operation in self._sync_operations:
-            stats[operation.status] += 1
-        
+        stats.update(self._status_column.counts)
         return stats
@@ -3,12 +3,40 @@
 """
 
 import json
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    _loads = json.loads
+
+
+# 最近一次格式化的时间戳: [time.time(), isoformat 字符串]
+_last_ts: List[Any] = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """返回当前时间的 ISO 字符串，同一毫秒内复用上次的格式化结果"""
+    t = time.time()
+    if t - _last_ts[0] > 0.001:
+        _last_ts[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _last_ts[1]
+
 
 class TaskStatus(Enum):
     """任务状态"""
@@ -26,6 +54,22 @@ class SyncDirection(Enum):
     BIDIRECTIONAL = "bidirectional"       # 双向同步
 
 
+# 状态 / 同步方向的显示文本
+_STATUS_DISPLAY = {
+    TaskStatus.CREATED: "已创建",
+    TaskStatus.RUNNING: "运行中",
+    TaskStatus.COMPLETED: "已完成",
+    TaskStatus.FAILED: "失败",
+    TaskStatus.PAUSED: "暂停"
+}
+
+_DIRECTION_DISPLAY = {
+    SyncDirection.NOTION_TO_LOCAL: "Notion → 本地",
+    SyncDirection.LOCAL_TO_NOTION: "本地 → Notion",
+    SyncDirection.BIDIRECTIONAL: "双向同步"
+}
+
+
 @dataclass
 class NotionSource:
     """Notion 源配置"""
@@ -93,6 +137,12 @@ class SyncStats:
 class SyncTask:
     """同步任务"""
     
+    # 使用 __slots__ 省去每个实例的 __dict__
+    __slots__ = ("task_id", "name", "notion_source", "local_target",
+                 "sync_direction", "sync_options", "status", "created_time",
+                 "last_modified", "error_message", "stats",
+                 "_json_cache")
+    
     def __init__(self, 
                  name: str,
                  notion_source: NotionSource,
@@ -110,23 +160,32 @@ class SyncTask:
         
         # 状态信息
         self.status = TaskStatus.CREATED
-        self.created_time = datetime.now().isoformat()
-        self.last_modified = datetime.now().isoformat()
+        self.created_time = _now_iso()
+        self.last_modified = _now_iso()
         self.error_message = ""
         
         # 统计信息
         self.stats = SyncStats()
     
+    def __setattr__(self, name: str, value: Any):
+        # 任何字段被赋值都会使 JSON 缓存失效。
+        # 注意：原地修改嵌套的配置对象（如 task.sync_options.batch_size = 10、
+        # task.stats.files_synced += 1）不经过这里，缓存不会失效——
+        # 必须整体替换（如 update_stats），否则 to_json 和任务文件会写出旧值。
+        object.__setattr__(self, name, value)
+        if name != "_json_cache":
+            object.__setattr__(self, "_json_cache", None)
+    
     def update_status(self, status: TaskStatus, error_message: str = ""):
         """更新任务状态"""
         self.status = status
-        self.last_modified = datetime.now().isoformat()
+        self.last_modified = _now_iso()
         self.error_message = error_message
     
     def update_stats(self, stats: SyncStats):
         """更新统计信息"""
         self.stats = stats
-        self.last_modified = datetime.now().isoformat()
+        self.last_modified = _now_iso()
     
     def get_display_name(self) -> str:
         """获取显示名称"""
@@ -134,23 +193,11 @@ class SyncTask:
     
     def get_status_display(self) -> str:
         """获取状态显示文本"""
-        status_map = {
-            TaskStatus.CREATED: "已创建",
-            TaskStatus.RUNNING: "运行中",
-            TaskStatus.COMPLETED: "已完成",
-            TaskStatus.FAILED: "失败",
-            TaskStatus.PAUSED: "暂停"
-        }
-        return status_map.get(self.status, "未知")
+        return _STATUS_DISPLAY.get(self.status, "未知")
     
     def get_direction_display(self) -> str:
         """获取同步方向显示文本"""
-        direction_map = {
-            SyncDirection.NOTION_TO_LOCAL: "Notion → 本地",
-            SyncDirection.LOCAL_TO_NOTION: "本地 → Notion",
-            SyncDirection.BIDIRECTIONAL: "双向同步"
-        }
-        return direction_map.get(self.sync_direction, "未知")
+        return _DIRECTION_DISPLAY.get(self.sync_direction, "未知")
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -189,11 +236,13 @@ class SyncTask:
         return task
     
     def to_json(self) -> str:
-        """转换为 JSON 字符串"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        """转换为 JSON 字符串；结果缓存到下一次字段赋值为止"""
+        if self._json_cache is None:
+            self._json_cache = _dumps(self.to_dict())
+        return self._json_cache
     
     @classmethod
     def from_json(cls, json_str: str) -> 'SyncTask':
         """从 JSON 字符串创建任务"""
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
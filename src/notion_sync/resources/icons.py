@@ -3,370 +3,350 @@
 提供应用程序中使用的所有图标
 """
 
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QPolygon
-from PySide6.QtCore import Qt, QSize, QPoint
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PySide6.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QPainter, QColor, QPolygon
+from PySide6.QtCore import Qt, QSize, QPoint, QLine, QObject, QThreadPool, Signal, Slot
 from PySide6.QtWidgets import QStyle, QApplication
 
+try:
+    # 预渲染 PNG 数据，由 make icons（make build 会先执行）生成；直接从源码运行时没有该文件，图标在运行时绘制
+    from notion_sync.resources._baked_icons import ICON_BYTES
+except ImportError:
+    ICON_BYTES = {}
 
-class IconManager:
-    """图标管理器 - 提供统一的图标访问"""
-    
-    _instance = None
-    _icons = {}
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
-            # 延迟创建图标，直到 QApplication 存在
-            self._icons_created = False
-    
-    def _create_icons(self):
-        """创建所有图标"""
-        # 使用系统图标和自定义图标
-        style = QApplication.style()
-        
-        # 基础操作图标
-        self._icons['analyze'] = self._create_analyze_icon()
-        self._icons['sync'] = self._create_sync_icon()
-        self._icons['connect'] = self._create_connect_icon()
-        self._icons['disconnect'] = self._create_disconnect_icon()
-        self._icons['refresh'] = style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
-        self._icons['folder'] = style.standardIcon(QStyle.StandardPixmap.SP_DirIcon)
-        self._icons['file'] = style.standardIcon(QStyle.StandardPixmap.SP_FileIcon)
-        self._icons['settings'] = style.standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
-        
-        # 状态图标
-        self._icons['success'] = self._create_success_icon()
-        self._icons['error'] = self._create_error_icon()
-        self._icons['warning'] = self._create_warning_icon()
-        self._icons['info'] = self._create_info_icon()
-        
-        # 同步方向图标
-        self._icons['sync_bidirectional'] = self._create_bidirectional_icon()
-        self._icons['sync_to_notion'] = self._create_to_notion_icon()
-        self._icons['sync_from_notion'] = self._create_from_notion_icon()
-        
-        # 文件类型图标
-        self._icons['markdown'] = self._create_markdown_icon()
-        self._icons['text'] = self._create_text_icon()
-        self._icons['image'] = self._create_image_icon()
-        
-        # 应用图标
-        self._icons['app'] = self._create_app_icon()
-    
-    def _create_analyze_icon(self) -> QIcon:
-        """创建分析图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制放大镜
-        painter.setPen(QColor("#4A90E2"))
-        painter.setBrush(QColor("#4A90E2"))
-        painter.drawEllipse(2, 2, 8, 8)
-        painter.drawLine(9, 9, 14, 14)
-        
-        painter.end()
-        return QIcon(pixmap)
-    
-    def _create_sync_icon(self) -> QIcon:
-        """创建同步图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制双向箭头
-        painter.setPen(QColor("#34C759"))
-        painter.setBrush(QColor("#34C759"))
-        
-        # 上箭头
-        painter.drawLine(8, 2, 8, 6)
-        painter.drawLine(6, 4, 8, 2)
-        painter.drawLine(10, 4, 8, 2)
-        
-        # 下箭头
-        painter.drawLine(8, 10, 8, 14)
-        painter.drawLine(6, 12, 8, 14)
-        painter.drawLine(10, 12, 8, 14)
-        
-        painter.end()
-        return QIcon(pixmap)
-    
-    def _create_connect_icon(self) -> QIcon:
-        """创建连接图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制链接图标
-        painter.setPen(QColor("#007AFF"))
-        painter.setBrush(QColor("#007AFF"))
-        
-        # 绘制链条
-        painter.drawEllipse(2, 2, 6, 6)
-        painter.drawEllipse(8, 8, 6, 6)
-        painter.drawLine(6, 6, 10, 10)
-        
-        painter.end()
-        return QIcon(pixmap)
-    
-    def _create_disconnect_icon(self) -> QIcon:
-        """创建断开连接图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制断开的链接
-        painter.setPen(QColor("#FF3B30"))
-        painter.setBrush(QColor("#FF3B30"))
-        
-        painter.drawEllipse(2, 2, 6, 6)
-        painter.drawEllipse(8, 8, 6, 6)
-        # 绘制断开的线
-        painter.drawLine(6, 6, 8, 8)
-        painter.drawLine(8, 10, 10, 8)
-        
-        painter.end()
-        return QIcon(pixmap)
-    
-    def _create_success_icon(self) -> QIcon:
-        """创建成功图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制对勾
-        painter.setPen(QColor("#34C759"))
-        painter.setBrush(QColor("#34C759"))
-        painter.drawEllipse(1, 1, 14, 14)
-        
-        painter.setPen(QColor("white"))
-        painter.drawLine(4, 8, 7, 11)
-        painter.drawLine(7, 11, 12, 5)
-        
-        painter.end()
-        return QIcon(pixmap)
+
+# 随包发布的矢量图标，Qt 按请求的尺寸光栅化，任务栏等大尺寸场景同样清晰
+_FILE_ICONS = {
+    'app': Path(__file__).parent / "app_icon.svg",
+}
+
+# 预渲染图标按 2 倍像素比绘制，高 DPI 屏幕上无需放大
+_BAKED_PIXEL_RATIO = 2.0
+
+# 绘制时的设备像素比，None 表示跟随主屏幕（tools/bake_icons.py 会固定为 2 倍）
+_pixel_ratio: Optional[float] = None
+
+# 图标颜色（QColor 不依赖 QApplication，可在模块加载时创建）
+_BLUE = QColor("#4A90E2")
+_SYSTEM_BLUE = QColor("#007AFF")
+_GREEN = QColor("#34C759")
+_RED = QColor("#FF3B30")
+_ORANGE = QColor("#FF9500")
+_GRAY = QColor("#666666")
+_WHITE = QColor("white")
+
+
+def _pixmap_cache_key(name: str) -> str:
+    """自定义图标在 QPixmapCache 中的键"""
+    return f"nsicon:{name}"
+
+
+def _device_pixel_ratio() -> float:
+    """获取绘制图标使用的设备像素比"""
+    if _pixel_ratio is not None:
+        return _pixel_ratio
+    screen = QApplication.primaryScreen()
+    return screen.devicePixelRatio() if screen else 1.0
+
+
+@contextmanager
+def _canvas(size: int = 16) -> Iterator[Tuple[QImage, QPainter]]:
+    """提供已清空为透明并开启抗锯齿的画布，按设备像素比分配像素
     
-    def _create_error_icon(self) -> QIcon:
-        """创建错误图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制错误图标
-        painter.setPen(QColor("#FF3B30"))
-        painter.setBrush(QColor("#FF3B30"))
-        painter.drawEllipse(1, 1, 14, 14)
-        
-        painter.setPen(QColor("white"))
-        painter.drawLine(5, 5, 11, 11)
-        painter.drawLine(5, 11, 11, 5)
-        
+    在 QImage 上绘制：光栅绘制不依赖窗口系统，也可以在工作线程中进行
+    """
+    ratio = _device_pixel_ratio()
+    image = QImage(round(size * ratio), round(size * ratio),
+                   QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    try:
+        yield image, painter
+    finally:
         painter.end()
-        return QIcon(pixmap)
+
+
+# 图标绘制指令: (操作, 参数...)，导入时由 _compile_spec 解析为 QPainter 方法
+_PAINTER_OPS = {
+    'pen': 'setPen',
+    'brush': 'setBrush',
+    'ellipse': 'drawEllipse',
+    'line': 'drawLine',
+    'lines': 'drawLines',
+    'rect': 'drawRect',
+    'rounded_rect': 'drawRoundedRect',
+    'polygon': 'drawPolygon',
+    'text': 'drawText',
+}
+
+# 自定义图标按需绘制，直到 QApplication 存在且首次请求时才绘制
+_ICON_SPECS: Dict[str, List[tuple]] = {
+    # 基础操作图标
+    'analyze': [  # 放大镜
+        ('pen', _BLUE), ('brush', _BLUE),
+        ('ellipse', 2, 2, 8, 8),
+        ('line', 9, 9, 14, 14),
+    ],
+    'sync': [  # 上下双向箭头
+        ('pen', _GREEN), ('brush', _GREEN),
+        ('lines', [
+            QLine(8, 2, 8, 6), QLine(6, 4, 8, 2), QLine(10, 4, 8, 2),
+            QLine(8, 10, 8, 14), QLine(6, 12, 8, 14), QLine(10, 12, 8, 14),
+        ]),
+    ],
+    'connect': [  # 链条
+        ('pen', _SYSTEM_BLUE), ('brush', _SYSTEM_BLUE),
+        ('ellipse', 2, 2, 6, 6),
+        ('ellipse', 8, 8, 6, 6),
+        ('line', 6, 6, 10, 10),
+    ],
+    'disconnect': [  # 断开的链条
+        ('pen', _RED), ('brush', _RED),
+        ('ellipse', 2, 2, 6, 6),
+        ('ellipse', 8, 8, 6, 6),
+        ('lines', [QLine(6, 6, 8, 8), QLine(8, 10, 10, 8)]),
+    ],
     
-    def _create_warning_icon(self) -> QIcon:
-        """创建警告图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制警告三角形
-        painter.setPen(QColor("#FF9500"))
-        painter.setBrush(QColor("#FF9500"))
-
-        points = [
-            QPoint(8, 2),
-            QPoint(14, 14),
-            QPoint(2, 14)
-        ]
-        polygon = QPolygon(points)
-        painter.drawPolygon(polygon)
-        
-        painter.setPen(QColor("white"))
-        painter.drawLine(8, 5, 8, 10)
-        painter.drawEllipse(7, 11, 2, 2)
-        
-        painter.end()
-        return QIcon(pixmap)
+    # 状态图标
+    'success': [  # 圆形对勾
+        ('pen', _GREEN), ('brush', _GREEN),
+        ('ellipse', 1, 1, 14, 14),
+        ('pen', _WHITE),
+        ('lines', [QLine(4, 8, 7, 11), QLine(7, 11, 12, 5)]),
+    ],
+    'error': [  # 圆形叉号
+        ('pen', _RED), ('brush', _RED),
+        ('ellipse', 1, 1, 14, 14),
+        ('pen', _WHITE),
+        ('lines', [QLine(5, 5, 11, 11), QLine(5, 11, 11, 5)]),
+    ],
+    'warning': [  # 警告三角形
+        ('pen', _ORANGE), ('brush', _ORANGE),
+        ('polygon', QPolygon([QPoint(8, 2), QPoint(14, 14), QPoint(2, 14)])),
+        ('pen', _WHITE),
+        ('line', 8, 5, 8, 10),
+        ('ellipse', 7, 11, 2, 2),
+    ],
+    'info': [  # 圆形 i
+        ('pen', _SYSTEM_BLUE), ('brush', _SYSTEM_BLUE),
+        ('ellipse', 1, 1, 14, 14),
+        ('pen', _WHITE),
+        ('ellipse', 7, 4, 2, 2),
+        ('line', 8, 7, 8, 12),
+    ],
     
-    def _create_info_icon(self) -> QIcon:
-        """创建信息图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制信息图标
-        painter.setPen(QColor("#007AFF"))
-        painter.setBrush(QColor("#007AFF"))
-        painter.drawEllipse(1, 1, 14, 14)
-        
-        painter.setPen(QColor("white"))
-        painter.drawEllipse(7, 4, 2, 2)
-        painter.drawLine(8, 7, 8, 12)
-        
-        painter.end()
-        return QIcon(pixmap)
+    # 同步方向图标
+    'sync_bidirectional': [  # 左右箭头
+        ('pen', _BLUE),
+        ('lines', [
+            QLine(2, 6, 14, 6), QLine(2, 10, 14, 10),
+            QLine(12, 4, 14, 6), QLine(12, 8, 14, 6),
+            QLine(4, 8, 2, 10), QLine(4, 12, 2, 10),
+        ]),
+    ],
+    'sync_to_notion': [
+        ('pen', _GREEN),
+        ('lines', [QLine(2, 8, 14, 8), QLine(12, 6, 14, 8), QLine(12, 10, 14, 8)]),
+    ],
+    'sync_from_notion': [
+        ('pen', _ORANGE),
+        ('lines', [QLine(2, 8, 14, 8), QLine(4, 6, 2, 8), QLine(4, 10, 2, 8)]),
+    ],
     
-    def _create_bidirectional_icon(self) -> QIcon:
-        """创建双向同步图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#4A90E2"))
-        # 左右箭头
-        painter.drawLine(2, 6, 14, 6)
-        painter.drawLine(2, 10, 14, 10)
-        
-        # 箭头头部
-        painter.drawLine(12, 4, 14, 6)
-        painter.drawLine(12, 8, 14, 6)
-        painter.drawLine(4, 8, 2, 10)
-        painter.drawLine(4, 12, 2, 10)
-        
-        painter.end()
-        return QIcon(pixmap)
+    # 文件类型图标
+    'markdown': [
+        ('pen', _BLUE),
+        ('text', 2, 12, "M"),
+    ],
+    'text': [
+        ('pen', _GRAY),
+        ('lines', [QLine(3, 4, 13, 4), QLine(3, 7, 13, 7), QLine(3, 10, 10, 10)]),
+    ],
+    'image': [
+        ('pen', _ORANGE),
+        ('rect', 2, 2, 12, 12),
+        ('ellipse', 4, 4, 3, 3),
+        ('line', 6, 10, 14, 2),
+    ],
     
-    def _create_to_notion_icon(self) -> QIcon:
-        """创建到Notion图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#34C759"))
-        painter.drawLine(2, 8, 14, 8)
-        painter.drawLine(12, 6, 14, 8)
-        painter.drawLine(12, 10, 14, 8)
-        
-        painter.end()
-        return QIcon(pixmap)
+    # 应用图标（优先使用 app_icon.svg，缺失时才绘制）
+    'app': [
+        ('pen', _BLUE), ('brush', _BLUE),
+        ('rounded_rect', 4, 4, 24, 24, 4, 4),
+        ('pen', _WHITE),
+        ('text', 8, 20, "NS"),
+    ],
+}
+
+# 非 16x16 的图标尺寸
+_ICON_SIZES = {
+    'app': 32,
+}
+
+
+def _compile_spec(spec: List[tuple]) -> Tuple[Tuple[Callable, tuple], ...]:
+    """把绘制指令解析为 (QPainter 未绑定方法, 参数) 序列，绘制时不再查表和 getattr"""
+    return tuple(
+        (getattr(QPainter, _PAINTER_OPS[op]), tuple(args))
+        for op, *args in spec
+    )
+
+
+# 导入时一次性解析全部图标，未知操作在此处即报错
+_COMPILED_SPECS = {name: _compile_spec(spec) for name, spec in _ICON_SPECS.items()}
+
+
+def _create_icon_image(name: str) -> QImage:
+    """绘制自定义图标，可在工作线程中调用"""
+    with _canvas(_ICON_SIZES.get(name, 16)) as (image, painter):
+        for method, args in _COMPILED_SPECS[name]:
+            method(painter, *args)
+    return image
+
+
+# 系统图标：优先使用图标主题（由平台缓存），主题缺失时退回样式提供的标准图标
+_STANDARD_ICONS = {
+    'refresh': ('view-refresh', QStyle.StandardPixmap.SP_BrowserReload),
+    'folder': ('folder', QStyle.StandardPixmap.SP_DirIcon),
+    'file': ('text-x-generic', QStyle.StandardPixmap.SP_FileIcon),
+    'settings': ('preferences-system', QStyle.StandardPixmap.SP_ComputerIcon),
+}
+
+# 状态 -> 图标名称
+_STATUS_MAP: Dict[str, str] = {
+    'success': 'success',
+    'error': 'error',
+    'warning': 'warning',
+    'info': 'info',
+    'connected': 'connect',
+    'disconnected': 'disconnect',
+    'syncing': 'sync',
+    'analyzing': 'analyze',
+}
+
+
+def _load_baked_pixmap(data: bytes) -> QPixmap:
+    """从预渲染的 PNG 数据加载位图"""
+    pixmap = QPixmap()
+    pixmap.loadFromData(data, "PNG")
+    pixmap.setDevicePixelRatio(_BAKED_PIXEL_RATIO)
+    return pixmap
+
+
+def _render_pixmap(name: str) -> Optional[QPixmap]:
+    """获取自定义图标的位图：优先预渲染数据，其次运行时绘制"""
+    if name in ICON_BYTES:
+        return _load_baked_pixmap(ICON_BYTES[name])
+    if name not in _ICON_SPECS:
+        return None
+    return QPixmap.fromImage(_create_icon_image(name))
+
+
+class _IconInstaller(QObject):
+    """在主线程接收工作线程绘制好的图像并放入 QPixmapCache"""
     
-    def _create_from_notion_icon(self) -> QIcon:
-        """创建从Notion图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#FF9500"))
-        painter.drawLine(2, 8, 14, 8)
-        painter.drawLine(4, 6, 2, 8)
-        painter.drawLine(4, 10, 2, 8)
-        
-        painter.end()
-        return QIcon(pixmap)
+    # 跨线程发射时自动排队到本对象所在的主线程
+    images_ready = Signal(object)
     
-    def _create_markdown_icon(self) -> QIcon:
-        """创建Markdown图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#4A90E2"))
-        painter.drawText(2, 12, "M")
-        
-        painter.end()
-        return QIcon(pixmap)
+    def __init__(self):
+        super().__init__()
+        self.images_ready.connect(self.install)
     
-    def _create_text_icon(self) -> QIcon:
-        """创建文本图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#666666"))
-        painter.drawLine(3, 4, 13, 4)
-        painter.drawLine(3, 7, 13, 7)
-        painter.drawLine(3, 10, 10, 10)
-        
-        painter.end()
-        return QIcon(pixmap)
+    @Slot(object)
+    def install(self, images: Dict[str, QImage]) -> None:
+        """把图像转换为位图（仅此步骤需要在主线程进行）"""
+        for name, image in images.items():
+            QPixmapCache.insert(_pixmap_cache_key(name), QPixmap.fromImage(image))
+
+
+_installer: Optional[_IconInstaller] = None
+
+
+def _create_all_images(names: List[str]) -> Dict[str, QImage]:
+    """绘制指定的自定义图标，可在工作线程中调用"""
+    return {name: _create_icon_image(name) for name in names}
+
+
+# 系统图标和文件图标的 QIcon 按名称缓存：主题/样式查询和 SVG 解析只做一次，
+# 它们的位图由 Qt 自行管理，不占用 QPixmapCache
+_icon_cache: Dict[str, QIcon] = {}
+
+
+def _lookup_icon(name: str) -> Optional[QIcon]:
+    """获取系统图标或随包发布的文件图标，其他名称返回 None"""
+    if name in _STANDARD_ICONS:
+        theme_name, standard_pixmap = _STANDARD_ICONS[name]
+        if QIcon.hasThemeIcon(theme_name):
+            return QIcon.fromTheme(theme_name)
+        return QApplication.style().standardIcon(standard_pixmap)
     
-    def _create_image_icon(self) -> QIcon:
-        """创建图片图标"""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setPen(QColor("#FF9500"))
-        painter.drawRect(2, 2, 12, 12)
-        painter.drawEllipse(4, 4, 3, 3)
-        painter.drawLine(6, 10, 14, 2)
-        
-        painter.end()
-        return QIcon(pixmap)
+    icon_path = _FILE_ICONS.get(name)
+    if icon_path is not None and icon_path.exists():
+        return QIcon(str(icon_path))
+    return None
+
+
+def get_icon(name: str) -> QIcon:
+    """获取图标（需在 QApplication 创建后调用）
     
-    def _create_app_icon(self) -> QIcon:
-        """创建应用图标"""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # 绘制应用图标
-        painter.setPen(QColor("#4A90E2"))
-        painter.setBrush(QColor("#4A90E2"))
-        painter.drawRoundedRect(4, 4, 24, 24, 4, 4)
-        
-        painter.setPen(QColor("white"))
-        painter.drawText(8, 20, "NS")
-        
-        painter.end()
-        return QIcon(pixmap)
+    自定义图标的位图只存放在 QPixmapCache 中，由它按容量淘汰；QIcon 每次从位图重新包装
+    """
+    icon = _icon_cache.get(name)
+    if icon is not None:
+        return icon
+    icon = _lookup_icon(name)
+    if icon is not None:
+        _icon_cache[name] = icon
+        return icon
     
-    def get_icon(self, name: str) -> QIcon:
-        """获取图标"""
-        if not self._icons_created:
-            self._create_icons()
-            self._icons_created = True
-        return self._icons.get(name, QIcon())
+    # 自定义图标的位图存放在 QPixmapCache 中，后台预绘制的结果也从这里取用
+    key = _pixmap_cache_key(name)
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = _render_pixmap(name)
+        if pixmap is None:
+            return QIcon()
+        QPixmapCache.insert(key, pixmap)
     
-    def get_status_icon(self, status: str) -> QIcon:
-        """根据状态获取图标"""
-        if not self._icons_created:
-            self._create_icons()
-            self._icons_created = True
-        status_map = {
-            'success': 'success',
-            'error': 'error',
-            'warning': 'warning',
-            'info': 'info',
-            'connected': 'connect',
-            'disconnected': 'disconnect',
-            'syncing': 'sync',
-            'analyzing': 'analyze'
-        }
-        return self.get_icon(status_map.get(status, 'info'))
-
-
-# 全局图标管理器实例
-icon_manager = IconManager()
+    # 位图自带设备像素比，Qt 按逻辑尺寸选用而无需每次绘制时缩放
+    icon = QIcon()
+    icon.addPixmap(pixmap)
+    return icon
 
 
-def get_icon(name: str) -> QIcon:
-    """获取图标的便捷函数"""
-    return icon_manager.get_icon(name)
+def get_status_icon(status: str) -> QIcon:
+    """根据状态获取图标"""
+    return get_icon(_STATUS_MAP.get(status, 'info'))
 
 
-def get_status_icon(status: str) -> QIcon:
-    """获取状态图标的便捷函数"""
-    return icon_manager.get_status_icon(status)
+def warm_up_icons() -> None:
+    """在线程池中预先绘制全部自定义图标，不阻塞界面线程
+    
+    需在 QApplication 创建后于主线程调用。已有预渲染数据或已缓存的图标会被跳过。
+    """
+    global _pixel_ratio, _installer
+    
+    names = [
+        name for name in _ICON_SPECS
+        if name not in ICON_BYTES
+        and name not in _FILE_ICONS
+        and not QPixmapCache.find(_pixmap_cache_key(name), QPixmap())
+    ]
+    if not names:
+        return
+    
+    # 屏幕信息只能在主线程读取，先固定像素比再交给工作线程
+    if _pixel_ratio is None:
+        _pixel_ratio = _device_pixel_ratio()
+    if _installer is None:
+        _installer = _IconInstaller()
+    
+    installer = _installer
+    QThreadPool.globalInstance().start(
+        lambda: installer.images_ready.emit(_create_all_images(names))
+    )
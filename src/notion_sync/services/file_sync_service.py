@@ -3,41 +3,203 @@
 """
 
 import os
+import re
+import mmap
+import stat
 import shutil
-import hashlib
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
-from datetime import datetime
+from typing import Any, Iterator, List, Dict, Optional, Callable, Set
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
 from PySide6.QtCore import QObject, Signal, QThread, QTimer
 from notion_sync.utils.logging_config import LoggerMixin
+from notion_sync.utils.rate_limiter import RateLimiter
+from notion_sync.utils.checksum import CHECKSUM_ALGORITHM, new_checksum_hasher
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps_json_bytes(obj: Any) -> bytes:
+        """序列化为缩进的 UTF-8 JSON 字节。"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps_json_bytes(obj: Any) -> bytes:
+        """序列化为缩进的 UTF-8 JSON 字节。"""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 超过此大小的文件通过 mmap 整体交给哈希器，避免逐块读取
+_MMAP_HASH_THRESHOLD = 1024 * 1024
+
+# 支持同步的文件扩展名
+_SUPPORTED_EXTENSIONS = frozenset({'.md', '.txt', '.json', '.html', '.png', '.jpg', '.jpeg', '.gif'})
+
+# Notion API 平均限速约为每秒 3 个请求
+_NOTION_REQUESTS_PER_SECOND = 3.0
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 示例下载目录中的 README 内容
+_SAMPLE_README_TEMPLATE = """# {path}
+
+这是从云端下载的示例内容。
+
+## 内容说明
+
+- 这是一个示例文档
+- 来源：{path}
+- 下载时间：{downloaded_at}
+
+## 功能特性
+
+1. 支持 Markdown 格式
+2. 自动同步
+3. 版本控制
+
+> 注意：这是演示内容，实际使用时会从真实的云端服务下载内容。
+"""
+
+# 已同步文件累计到此数量时才发出一次批量信号
+_SYNCED_BATCH_SIZE = 50
+
+# 进度信号的最小发送间隔（秒）
+_PROGRESS_INTERVAL = 0.1
+
+# 本地文件未变化且距上次同步不超过此间隔时，双向同步跳过对远程的检查
+_REMOTE_RECHECK_INTERVAL = timedelta(minutes=5)
+
+
+class HashCache:
+    """持久化的文件哈希缓存。
+    
+    以路径为键，记录计算哈希时的 (mtime_ns, size)；两者都未变化时直接复用，
+    数据保存在应用数据库的 local_checksum_cache 表中。
+    """
+    
+    def __init__(self, database_manager):
+        self._database_manager = database_manager
+        self._lock = threading.Lock()
+        self._entries = database_manager.get_local_checksums(CHECKSUM_ALGORITHM)
+        self._dirty: Dict[str, tuple] = {}
+    
+    def get(self, path: str, file_stat: os.stat_result) -> Optional[str]:
+        """获取缓存的哈希值，文件已变化时返回 None。"""
+        entry = self._entries.get(path)
+        if entry and entry[0] == file_stat.st_mtime_ns and entry[1] == file_stat.st_size:
+            return entry[2]
+        return None
+    
+    def last_checksum(self, path: str) -> Optional[str]:
+        """获取最近记录的哈希值，不检查文件此后是否变化。"""
+        entry = self._entries.get(path)
+        return entry[2] if entry else None
+    
+    def put(self, path: str, file_stat: os.stat_result, file_hash: str) -> None:
+        """记录新计算的哈希值，调用 flush 后才写入数据库。"""
+        entry = (file_stat.st_mtime_ns, file_stat.st_size, file_hash)
+        with self._lock:
+            self._entries[path] = entry
+            self._dirty[path] = entry
+    
+    def flush(self) -> None:
+        """把新增的哈希值批量写入数据库。"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if dirty:
+            self._database_manager.save_local_checksums(dirty, CHECKSUM_ALGORITHM)
+
+
+def _hash_file(path: str, size: int) -> str:
+    """计算文件哈希值；大文件通过 mmap 整体交给哈希器，读取失败时返回空字符串。"""
+    hasher = new_checksum_hasher()
+    try:
+        with open(path, "rb") as f:
+            if size >= _MMAP_HASH_THRESHOLD:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hasher.update(mm)
+                    return hasher.hexdigest()
+                except (OSError, ValueError):
+                    # 无法映射的文件（如特殊文件系统）回退到分块读取
+                    f.seek(0)
+            for chunk in iter(lambda: f.read(_MMAP_HASH_THRESHOLD), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    except Exception:
+        return ""
+
+
+def _read_text_file(path: Path) -> str:
+    """读取 UTF-8 文本文件；大文件直接从 mmap 解码，省去中间的 bytes 副本。"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_HASH_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, "utf-8")
+            except (OSError, ValueError):
+                f.seek(0)
+                content = f.read().decode("utf-8")
+        else:
+            content = f.read().decode("utf-8")
+    # 与文本模式读取保持一致：统一换行符
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 class FileInfo:
     """文件信息类。"""
     
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, hash_cache: Optional[HashCache] = None):
         self.path = path
         self.name = path.name
-        self.size = path.stat().st_size if path.exists() else 0
-        self.modified = datetime.fromtimestamp(path.stat().st_mtime) if path.exists() else datetime.now()
-        self.hash = self._calculate_hash() if path.is_file() else None
-        self.is_directory = path.is_dir()
+        self._hash_cache = hash_cache
+        # 只调用一次 stat，大小、修改时间和类型都从中读取
+        try:
+            self._stat: Optional[os.stat_result] = path.stat()
+        except OSError:
+            self._stat = None
+        self.size = self._stat.st_size if self._stat else 0
+        self.modified = datetime.fromtimestamp(self._stat.st_mtime) if self._stat else datetime.now()
+        self.is_directory = self._stat is not None and stat.S_ISDIR(self._stat.st_mode)
     
-    def _calculate_hash(self) -> str:
-        """计算文件哈希值。"""
-        if not self.path.is_file():
-            return ""
+    @property
+    def is_file(self) -> bool:
+        """是否为普通文件。"""
+        return self._stat is not None and stat.S_ISREG(self._stat.st_mode)
+    
+    @cached_property
+    def hash(self) -> Optional[str]:
+        """文件哈希值，首次访问时才读取文件内容计算。"""
+        if not self.is_file:
+            return None
         
-        hash_md5 = hashlib.md5()
-        try:
-            with open(self.path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception:
+        if self._hash_cache is None:
+            return self._calculate_hash()
+        
+        # 大小和修改时间（纳秒精度的整数）都未变化时复用持久化的哈希值
+        key = str(self.path)
+        file_hash = self._hash_cache.get(key, self._stat)
+        if file_hash is None:
+            file_hash = self._calculate_hash()
+            if file_hash:
+                self._hash_cache.put(key, self._stat, file_hash)
+        return file_hash
+    
+    def _calculate_hash(self) -> str:
+        """计算文件哈希值（仅用于变更检测，不需要密码学强度）。"""
+        if not self.is_file:
             return ""
+        return _hash_file(str(self.path), self.size)
     
     def to_dict(self) -> Dict:
         """转换为字典。"""
@@ -60,6 +222,36 @@ class SyncPair:
         self.sync_mode = sync_mode  # "local_to_remote", "remote_to_local", "bidirectional"
         self.last_sync = None
         self.enabled = True
+        # 上次同步后本地文件的大小和修改时间，用于快速判断是否变化
+        self.last_local_size: Optional[int] = None
+        self.last_local_mtime_ns: Optional[int] = None
+        # 上次成功上传时各本地文件的内容哈希: 本地路径 -> 哈希
+        self.upload_manifest: Dict[str, str] = {}
+    
+    def record_local_fingerprint(self) -> None:
+        """记录本地文件当前的大小和修改时间（目录不记录）。"""
+        try:
+            file_stat = self.local_path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+            self.last_local_size = file_stat.st_size
+            self.last_local_mtime_ns = file_stat.st_mtime_ns
+        else:
+            self.last_local_size = None
+            self.last_local_mtime_ns = None
+    
+    def local_unchanged(self, file_stat: Optional[os.stat_result] = None) -> bool:
+        """本地文件自上次同步后是否未变化（可传入已获取的 stat 结果）。"""
+        if self.last_local_mtime_ns is None:
+            return False
+        if file_stat is None:
+            try:
+                file_stat = self.local_path.stat()
+            except OSError:
+                return False
+        return (file_stat.st_size == self.last_local_size
+                and file_stat.st_mtime_ns == self.last_local_mtime_ns)
     
     def to_dict(self) -> Dict:
         """转换为字典。"""
@@ -68,7 +260,10 @@ class SyncPair:
             "remote_path": self.remote_path,
             "sync_mode": self.sync_mode,
             "last_sync": self.last_sync.isoformat() if self.last_sync else None,
-            "enabled": self.enabled
+            "enabled": self.enabled,
+            "last_local_size": self.last_local_size,
+            "last_local_mtime_ns": self.last_local_mtime_ns,
+            "upload_manifest": self.upload_manifest
         }
     
     @classmethod
@@ -76,110 +271,343 @@ class SyncPair:
         """从字典创建。"""
         pair = cls(data["local_path"], data["remote_path"], data["sync_mode"])
         pair.enabled = data.get("enabled", True)
+        pair.last_local_size = data.get("last_local_size")
+        pair.last_local_mtime_ns = data.get("last_local_mtime_ns")
+        pair.upload_manifest = dict(data.get("upload_manifest") or {})
         if data.get("last_sync"):
             pair.last_sync = datetime.fromisoformat(data["last_sync"])
         return pair
 
 
+# 需要同步的文件名：非隐藏（.）、非临时（~）且扩展名受支持；.tmp 不在支持列表中，自然被排除
+_SYNCABLE_NAME_RE = re.compile(
+    r"[^.~].*\.(?:" + "|".join(sorted(ext[1:] for ext in _SUPPORTED_EXTENSIONS)) + r")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """把时间转换为纪元以来的纳秒整数（无时区的时间按本地时间处理）。"""
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _is_syncable_name(name: str) -> bool:
+    """按文件名判断文件是否应该同步。"""
+    return _SYNCABLE_NAME_RE.fullmatch(name) is not None
+
+
+def _iter_syncable_files(root: str) -> Iterator[str]:
+    """递归遍历目录，产出需要同步的文件路径。
+    
+    使用 os.scandir：目录项自带类型信息，先按文件名过滤，只对通过的文件确认类型。
+    与 Path.rglob 一致，不进入指向目录的符号链接。
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif _is_syncable_name(entry.name) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            # 无权限或已被删除的目录直接跳过
+            continue
+
+
+def _prune_manifest(manifest: Dict[str, str], current: Set[str]) -> None:
+    """原地删除上传清单中不属于当前文件集合的条目。"""
+    for key in [key for key in manifest if key not in current]:
+        del manifest[key]
+
+
+def _plain_text(rich_text_array: List[Dict]) -> str:
+    """从富文本数组中提取纯文本。"""
+    return "".join(text_obj.get("plain_text", "") for text_obj in rich_text_array)
+
+
+def _block_text(block: Dict, block_type: str) -> str:
+    """提取块的富文本内容。"""
+    return _plain_text(block.get(block_type, {}).get("rich_text", []))
+
+
+# 块类型 -> 处理函数 (块的纯文本, 块) -> 输出行；未列出的块类型被忽略
+_MARKDOWN_HANDLERS: Dict[str, Callable[[str, Dict], tuple]] = {
+    "paragraph": lambda text, block: (text, ""),
+    "heading_1": lambda text, block: (f"# {text}", ""),
+    "heading_2": lambda text, block: (f"## {text}", ""),
+    "heading_3": lambda text, block: (f"### {text}", ""),
+    "bulleted_list_item": lambda text, block: (f"- {text}",),
+    "numbered_list_item": lambda text, block: (f"1. {text}",),
+    "code": lambda text, block: (f"```{block.get('code', {}).get('language', '')}", text, "```", ""),
+}
+
+_TEXT_HANDLERS: Dict[str, Callable[[str, Dict], tuple]] = {
+    "paragraph": lambda text, block: (text, ""),
+    "heading_1": lambda text, block: (text, ""),
+    "heading_2": lambda text, block: (text, ""),
+    "heading_3": lambda text, block: (text, ""),
+    "bulleted_list_item": lambda text, block: (f"• {text}",),
+    "numbered_list_item": lambda text, block: (f"• {text}",),
+}
+
+_HTML_HANDLERS: Dict[str, Callable[[str, Dict], tuple]] = {
+    "paragraph": lambda text, block: (f"<p>{text}</p>",),
+    "heading_1": lambda text, block: (f"<h1>{text}</h1>",),
+    "heading_2": lambda text, block: (f"<h2>{text}</h2>",),
+    "heading_3": lambda text, block: (f"<h3>{text}</h3>",),
+}
+
+
+def _html_header(title: str) -> List[str]:
+    """HTML 文档头部。"""
+    return [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        f"<title>{title}</title>",
+        "<meta charset='utf-8'>",
+        "</head>",
+        "<body>",
+        f"<h1>{title}</h1>"
+    ]
+
+
+# 格式 -> (处理函数表, 头部生成函数, 尾部行)
+_BLOCK_FORMATS = {
+    "markdown": (_MARKDOWN_HANDLERS, lambda title: [f"# {title}", ""], ()),
+    "text": (_TEXT_HANDLERS, lambda title: [title, "=" * len(title), ""], ()),
+    "html": (_HTML_HANDLERS, _html_header, ("</body>", "</html>")),
+}
+
+
+def _convert_blocks(title: str, blocks: List[Dict], fmt: str) -> str:
+    """按格式表将块列表转换为指定格式的文本。"""
+    handlers, make_header, footer = _BLOCK_FORMATS[fmt]
+    get_handler = handlers.get
+    lines = make_header(title)
+    for block in blocks:
+        block_type = block.get("type", "")
+        handler = get_handler(block_type)
+        if handler is not None:
+            lines.extend(handler(_block_text(block, block_type), block))
+    lines.extend(footer)
+    return "\n".join(lines)
+
+
 class FileSyncWorker(QThread, LoggerMixin):
     """文件同步工作线程。"""
     
     # 信号
     progress_updated = Signal(int, str)  # 进度百分比, 状态消息
-    file_synced = Signal(str, str)  # 文件路径, 操作类型
+    files_synced_batch = Signal(list)  # [(文件路径, 操作类型), ...]
     sync_completed = Signal(bool, str)  # 是否成功, 消息
     error_occurred = Signal(str)  # 错误消息
     
-    def __init__(self, sync_pairs: List[SyncPair], sync_mode: str = "bidirectional"):
+    def __init__(self, sync_pairs: List[SyncPair], sync_mode: str = "bidirectional",
+                 max_workers: int = 4, hash_cache: Optional[HashCache] = None,
+                 notion_client=None):
         super().__init__()
         self.sync_pairs = sync_pairs
         self.sync_mode = sync_mode
-        self.should_stop = False
+        self.hash_cache = hash_cache
+        self.notion_client = notion_client
+        # 同步对之间互不依赖，耗时主要在 Notion 网络请求上，用线程池并发处理
+        self.max_workers = max_workers
+        self._stop_event = threading.Event()
+        # 所有线程共享，限制对 Notion 的上传速率
+        self._rate_limiter = RateLimiter(_NOTION_REQUESTS_PER_SECOND)
+        # run() 开始时批量预取的远程页面信息: 远程路径 -> 页面信息
+        self._remote_infos: Dict[str, Optional[Dict]] = {}
+        # 已同步文件先在此缓冲，成批发出以减少跨线程信号
+        self._synced_buffer: List[tuple] = []
+        self._synced_lock = threading.Lock()
+        self._last_progress_time = 0.0
         self.current_progress = 0
     
+    @property
+    def should_stop(self) -> bool:
+        """是否已请求停止。"""
+        return self._stop_event.is_set()
+    
     def stop(self):
         """停止同步。"""
-        self.should_stop = True
+        self._stop_event.set()
+    
+    def _report_synced(self, file_path: str, operation: str):
+        """记录已同步的文件，缓冲满时发出批量信号。"""
+        with self._synced_lock:
+            self._synced_buffer.append((file_path, operation))
+            if len(self._synced_buffer) < _SYNCED_BATCH_SIZE:
+                return
+            batch, self._synced_buffer = self._synced_buffer, []
+        self.files_synced_batch.emit(batch)
+    
+    def _flush_synced(self):
+        """发出缓冲中剩余的已同步文件。"""
+        with self._synced_lock:
+            batch, self._synced_buffer = self._synced_buffer, []
+        if batch:
+            self.files_synced_batch.emit(batch)
+    
+    def _emit_progress(self, progress: int, message: str, force: bool = False):
+        """发出进度信号，两次之间至少间隔 _PROGRESS_INTERVAL 秒。"""
+        now = time.monotonic()
+        if force or now - self._last_progress_time >= _PROGRESS_INTERVAL:
+            self._last_progress_time = now
+            self.progress_updated.emit(progress, message)
     
     def run(self):
         """执行同步。"""
         try:
             self.logger.info(f"开始同步，模式: {self.sync_mode}")
-            self.progress_updated.emit(0, "正在准备同步...")
+            self._emit_progress(0, "正在准备同步...", force=True)
             
             total_pairs = len(self.sync_pairs)
             if total_pairs == 0:
                 self.sync_completed.emit(True, "没有需要同步的项目")
                 return
             
-            for i, pair in enumerate(self.sync_pairs):
-                if self.should_stop:
-                    self.sync_completed.emit(False, "同步已取消")
-                    return
-                
-                if not pair.enabled:
-                    continue
-                
-                # 更新进度
-                progress = int((i / total_pairs) * 100)
-                self.progress_updated.emit(progress, f"正在同步: {pair.local_path.name}")
-                
-                # 执行同步
-                self._sync_pair(pair)
-                
-                # 更新最后同步时间
-                pair.last_sync = datetime.now()
+            enabled_pairs = [pair for pair in self.sync_pairs if pair.enabled]
+            completed = 0
+            
+            # 并发预取所有双向同步对的远程信息，之后各同步对直接使用
+            self._prefetch_remote_infos(enabled_pairs)
             
-            self.progress_updated.emit(100, "同步完成")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._run_pair, pair): pair for pair in enabled_pairs}
+                for future in as_completed(futures):
+                    if self.should_stop:
+                        # 取消尚未开始的同步对，已在执行的会在退出 with 时等待完成
+                        for pending in futures:
+                            pending.cancel()
+                        self.sync_completed.emit(False, "同步已取消")
+                        return
+                    
+                    # 更新进度
+                    completed += 1
+                    progress = int((completed / len(enabled_pairs)) * 100)
+                    self._emit_progress(progress, f"已同步: {futures[future].local_path.name}")
+            
+            self._emit_progress(100, "同步完成", force=True)
             self.sync_completed.emit(True, f"成功同步 {total_pairs} 个项目")
             
         except Exception as e:
             self.logger.error(f"同步过程中发生错误: {e}")
             self.error_occurred.emit(f"同步失败: {str(e)}")
             self.sync_completed.emit(False, f"同步失败: {str(e)}")
+        
+        finally:
+            self._flush_synced()
+            
+            # 保存本次同步中新计算的文件哈希
+            if self.hash_cache is not None:
+                self.hash_cache.flush()
+    
+    def _is_bidirectional(self, pair: SyncPair) -> bool:
+        """同步对是否按双向模式同步（与 _sync_pair 的分派一致）。"""
+        return (self.sync_mode not in ("local_to_remote", "remote_to_local")
+                and pair.sync_mode not in ("local_to_remote", "remote_to_local"))
+    
+    def _can_skip_remote_check(self, pair: SyncPair,
+                               local_stat: Optional[os.stat_result] = None) -> bool:
+        """本地文件自上次同步后未变化且刚同步过时，无需检查远程。"""
+        return bool(pair.last_sync
+                    and datetime.now() - pair.last_sync < _REMOTE_RECHECK_INTERVAL
+                    and pair.local_unchanged(local_stat))
+    
+    def _prefetch_remote_infos(self, pairs: List[SyncPair]):
+        """并发获取双向同步对的远程页面信息。"""
+        self._remote_infos = {}
+        if not self._get_notion_client():
+            return
+        
+        remote_paths = list(dict.fromkeys(
+            pair.remote_path for pair in pairs
+            if self._is_bidirectional(pair) and not self._can_skip_remote_check(pair)
+        ))
+        if not remote_paths:
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            infos = executor.map(self._fetch_remote_file_info, remote_paths)
+            self._remote_infos = dict(zip(remote_paths, infos))
     
-    def _sync_pair(self, pair: SyncPair):
-        """同步单个同步对。"""
+    def _run_pair(self, pair: SyncPair):
+        """在线程池中同步单个同步对。"""
+        if self.should_stop:
+            return
+        
+        # 执行同步；只有同步成功才更新最后同步时间和本地文件指纹，
+        # 否则下次同步会走快速路径而跳过重试
+        if self._sync_pair(pair):
+            pair.last_sync = datetime.now()
+            pair.record_local_fingerprint()
+        
+        # 每个同步对完成后发出其已同步文件
+        self._flush_synced()
+    
+    def _sync_pair(self, pair: SyncPair) -> bool:
+        """同步单个同步对，返回是否成功。"""
         try:
             if self.sync_mode == "local_to_remote" or pair.sync_mode == "local_to_remote":
-                self._upload_to_remote(pair)
+                return self._upload_to_remote(pair)
             elif self.sync_mode == "remote_to_local" or pair.sync_mode == "remote_to_local":
-                self._download_from_remote(pair)
+                return self._download_from_remote(pair)
             else:  # bidirectional
-                self._bidirectional_sync(pair)
+                return self._bidirectional_sync(pair)
                 
         except Exception as e:
             self.logger.error(f"同步对 {pair.local_path} 失败: {e}")
             self.error_occurred.emit(f"同步 {pair.local_path.name} 失败: {str(e)}")
+            return False
     
-    def _upload_to_remote(self, pair: SyncPair):
-        """上传到远程。"""
+    def _upload_to_remote(self, pair: SyncPair) -> bool:
+        """上传到远程，返回是否成功。"""
         if not pair.local_path.exists():
             self.logger.warning(f"本地路径不存在: {pair.local_path}")
-            return
+            return False
 
         try:
             if pair.local_path.is_file():
                 # 上传单个文件
-                self._upload_file(pair.local_path, pair.remote_path)
+                self._upload_file(pair.local_path, pair.remote_path, pair.upload_manifest)
+                _prune_manifest(pair.upload_manifest, {str(pair.local_path)})
             else:
                 # 上传整个文件夹
-                self._upload_directory(pair.local_path, pair.remote_path)
+                self._upload_directory(pair.local_path, pair.remote_path, pair.upload_manifest)
+            return True
 
         except Exception as e:
             self.logger.error(f"上传失败: {e}")
             self.error_occurred.emit(f"上传失败: {str(e)}")
+            return False
+
+    def _upload_file(self, local_file: Path, remote_path: str,
+                     manifest: Optional[Dict[str, str]] = None):
+        """上传单个文件到 Notion。
+        
+        提供 manifest 时，内容与上次成功上传时相同的文件会被跳过。
+        """
+        file_hash = None
+        if manifest is not None:
+            file_hash = FileInfo(local_file, self.hash_cache).hash
+            if file_hash and manifest.get(str(local_file)) == file_hash:
+                self.logger.info(f"文件内容未变化，跳过上传: {local_file.name}")
+                return
 
-    def _upload_file(self, local_file: Path, remote_path: str):
-        """上传单个文件到 Notion。"""
         self.logger.info(f"上传文件: {local_file} -> {remote_path}")
+        self._rate_limiter.acquire()
 
         try:
             if local_file.suffix.lower() in ['.md', '.txt']:
                 # 上传文本文件为 Notion 页面
                 success = self._upload_text_file_to_notion(local_file, remote_path)
                 if success:
-                    self.file_synced.emit(str(local_file), "上传")
+                    self._report_synced(str(local_file), "上传")
                     self.logger.info(f"文本文件上传完成: {local_file.name}")
                 else:
                     raise Exception("文本文件上传失败")
@@ -188,7 +616,7 @@ class FileSyncWorker(QThread, LoggerMixin):
                 # 上传图片文件
                 success = self._upload_image_file_to_notion(local_file, remote_path)
                 if success:
-                    self.file_synced.emit(str(local_file), "上传")
+                    self._report_synced(str(local_file), "上传")
                     self.logger.info(f"图片文件上传完成: {local_file.name}")
                 else:
                     raise Exception("图片文件上传失败")
@@ -197,7 +625,7 @@ class FileSyncWorker(QThread, LoggerMixin):
                 # 上传其他支持的文件类型
                 success = self._upload_structured_file_to_notion(local_file, remote_path)
                 if success:
-                    self.file_synced.emit(str(local_file), "上传")
+                    self._report_synced(str(local_file), "上传")
                     self.logger.info(f"结构化文件上传完成: {local_file.name}")
                 else:
                     raise Exception("结构化文件上传失败")
@@ -210,15 +638,14 @@ class FileSyncWorker(QThread, LoggerMixin):
             self.logger.error(f"上传文件失败 {local_file}: {e}")
             raise
 
-        # 上传延迟
-        self.msleep(200)
+        if file_hash:
+            manifest[str(local_file)] = file_hash
 
     def _upload_text_file_to_notion(self, local_file: Path, remote_path: str) -> bool:
         """将文本文件上传为 Notion 页面。"""
         try:
             # 读取文件内容
-            with open(local_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text_file(local_file)
 
             # 获取 Notion 客户端（需要从应用控制器传递）
             notion_client = self._get_notion_client()
@@ -314,9 +741,7 @@ class FileSyncWorker(QThread, LoggerMixin):
 
     def _get_notion_client(self):
         """获取 Notion 客户端实例。"""
-        # 这里需要从应用控制器获取 Notion 客户端
-        # 暂时返回 None，需要在架构中改进
-        return None
+        return self.notion_client
 
     def _resolve_remote_path_to_page_id(self, remote_path: str) -> Optional[str]:
         """将远程路径解析为 Notion 页面ID。"""
@@ -330,36 +755,34 @@ class FileSyncWorker(QThread, LoggerMixin):
             # 这里需要从应用控制器或配置管理器获取映射
             return None
 
-    def _upload_directory(self, local_dir: Path, remote_path: str):
+    def _upload_directory(self, local_dir: Path, remote_path: str,
+                          manifest: Optional[Dict[str, str]] = None):
         """上传整个目录。"""
         self.logger.info(f"上传目录: {local_dir} -> {remote_path}")
 
-        # 遍历目录中的所有文件
-        for item in local_dir.rglob("*"):
-            if item.is_file() and self._should_sync_file(item):
-                # 计算相对路径
-                rel_path = item.relative_to(local_dir)
-                remote_file_path = f"{remote_path}/{rel_path}"
+        # 先收集需要同步的文件（按文件名过滤在前，避免对被忽略的文件做 stat）
+        files = list(_iter_syncable_files(str(local_dir)))
+
+        # 并发上传，请求速率由 _rate_limiter 控制
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._upload_file, Path(item),
+                                f"{remote_path}/{os.path.relpath(item, local_dir)}", manifest)
+                for item in files
+            ]
+            for future in as_completed(futures):
+                future.result()
 
-                # 上传文件
-                self._upload_file(item, remote_file_path)
+        # 本次遍历中已不存在的文件（删除、改名、被忽略）不再保留清单条目
+        if manifest is not None:
+            _prune_manifest(manifest, {str(Path(item)) for item in files})
 
     def _should_sync_file(self, file_path: Path) -> bool:
         """判断文件是否应该同步。"""
-        # 忽略隐藏文件
-        if file_path.name.startswith('.'):
-            return False
-
-        # 忽略临时文件
-        if file_path.name.startswith('~') or file_path.name.endswith('.tmp'):
-            return False
-
-        # 检查文件扩展名
-        supported_extensions = {'.md', '.txt', '.json', '.html', '.png', '.jpg', '.jpeg', '.gif'}
-        return file_path.suffix.lower() in supported_extensions
+        return _is_syncable_name(file_path.name)
     
-    def _download_from_remote(self, pair: SyncPair):
-        """从 Notion 下载内容到本地。"""
+    def _download_from_remote(self, pair: SyncPair) -> bool:
+        """从 Notion 下载内容到本地，返回是否成功。"""
         try:
             # 确保本地目录存在
             pair.local_path.parent.mkdir(parents=True, exist_ok=True)
@@ -368,10 +791,12 @@ class FileSyncWorker(QThread, LoggerMixin):
             success = self._download_notion_content_to_local(pair.remote_path, pair.local_path)
             if not success:
                 raise Exception("从 Notion 下载内容失败")
+            return True
 
         except Exception as e:
             self.logger.error(f"下载失败: {e}")
             self.error_occurred.emit(f"下载失败: {str(e)}")
+            return False
 
     def _download_notion_content_to_local(self, remote_path: str, local_path: Path) -> bool:
         """从 Notion 下载内容到本地文件。"""
@@ -416,24 +841,23 @@ class FileSyncWorker(QThread, LoggerMixin):
             title = self._extract_page_title(page_info)
 
             # 根据文件扩展名决定导出格式
-            if local_file.suffix.lower() == '.md':
-                content = self._convert_blocks_to_markdown(title, blocks)
-            elif local_file.suffix.lower() == '.txt':
-                content = self._convert_blocks_to_text(title, blocks)
-            elif local_file.suffix.lower() == '.json':
-                content = json.dumps(page_content, ensure_ascii=False, indent=2)
-            elif local_file.suffix.lower() == '.html':
-                content = self._convert_blocks_to_html(title, blocks)
+            suffix = local_file.suffix.lower()
+            if suffix == '.json':
+                # 直接序列化为字节写入，省去中间字符串和编码
+                data = _dumps_json_bytes(page_content)
+            elif suffix == '.txt':
+                data = self._convert_blocks_to_text(title, blocks).encode('utf-8')
+            elif suffix == '.html':
+                data = self._convert_blocks_to_html(title, blocks).encode('utf-8')
             else:
-                # 默认使用 Markdown 格式
-                content = self._convert_blocks_to_markdown(title, blocks)
+                # .md 及其他扩展名使用 Markdown 格式
+                data = self._convert_blocks_to_markdown(title, blocks).encode('utf-8')
 
             # 写入文件
             local_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(local_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            local_file.write_bytes(data)
 
-            self.file_synced.emit(str(local_file), "下载")
+            self._report_synced(str(local_file), "下载")
             self.logger.info(f"下载文件完成: {local_file}")
             return True
 
@@ -453,10 +877,7 @@ class FileSyncWorker(QThread, LoggerMixin):
 
             # 创建主文档文件
             main_file = local_dir / f"{title}.md"
-            content = self._convert_blocks_to_markdown(title, blocks)
-
-            with open(main_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            main_file.write_bytes(self._convert_blocks_to_markdown(title, blocks).encode('utf-8'))
 
             # 创建元数据文件
             metadata_file = local_dir / "metadata.json"
@@ -469,11 +890,10 @@ class FileSyncWorker(QThread, LoggerMixin):
                 "files": [main_file.name]
             }
 
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            metadata_file.write_bytes(_dumps_json_bytes(metadata))
 
-            self.file_synced.emit(str(main_file), "下载")
-            self.file_synced.emit(str(metadata_file), "下载")
+            self._report_synced(str(main_file), "下载")
+            self._report_synced(str(metadata_file), "下载")
             self.logger.info(f"下载目录完成: {local_dir}")
             return True
 
@@ -496,109 +916,19 @@ class FileSyncWorker(QThread, LoggerMixin):
 
     def _convert_blocks_to_markdown(self, title: str, blocks: List[Dict]) -> str:
         """将 Notion 块转换为 Markdown 格式。"""
-        lines = [f"# {title}", ""]
-
-        for block in blocks:
-            block_type = block.get("type", "")
-
-            if block_type == "paragraph":
-                text = self._extract_rich_text(block.get("paragraph", {}).get("rich_text", []))
-                lines.append(text)
-                lines.append("")
-
-            elif block_type == "heading_1":
-                text = self._extract_rich_text(block.get("heading_1", {}).get("rich_text", []))
-                lines.append(f"# {text}")
-                lines.append("")
-
-            elif block_type == "heading_2":
-                text = self._extract_rich_text(block.get("heading_2", {}).get("rich_text", []))
-                lines.append(f"## {text}")
-                lines.append("")
-
-            elif block_type == "heading_3":
-                text = self._extract_rich_text(block.get("heading_3", {}).get("rich_text", []))
-                lines.append(f"### {text}")
-                lines.append("")
-
-            elif block_type == "bulleted_list_item":
-                text = self._extract_rich_text(block.get("bulleted_list_item", {}).get("rich_text", []))
-                lines.append(f"- {text}")
-
-            elif block_type == "numbered_list_item":
-                text = self._extract_rich_text(block.get("numbered_list_item", {}).get("rich_text", []))
-                lines.append(f"1. {text}")
-
-            elif block_type == "code":
-                code_block = block.get("code", {})
-                language = code_block.get("language", "")
-                text = self._extract_rich_text(code_block.get("rich_text", []))
-                lines.append(f"```{language}")
-                lines.append(text)
-                lines.append("```")
-                lines.append("")
-
-        return "\n".join(lines)
+        return _convert_blocks(title, blocks, "markdown")
 
     def _convert_blocks_to_text(self, title: str, blocks: List[Dict]) -> str:
         """将 Notion 块转换为纯文本格式。"""
-        lines = [title, "=" * len(title), ""]
-
-        for block in blocks:
-            block_type = block.get("type", "")
-
-            if block_type in ["paragraph", "heading_1", "heading_2", "heading_3"]:
-                text = self._extract_rich_text(block.get(block_type, {}).get("rich_text", []))
-                lines.append(text)
-                lines.append("")
-
-            elif block_type in ["bulleted_list_item", "numbered_list_item"]:
-                text = self._extract_rich_text(block.get(block_type, {}).get("rich_text", []))
-                lines.append(f"• {text}")
-
-        return "\n".join(lines)
+        return _convert_blocks(title, blocks, "text")
 
     def _convert_blocks_to_html(self, title: str, blocks: List[Dict]) -> str:
         """将 Notion 块转换为 HTML 格式。"""
-        lines = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            f"<title>{title}</title>",
-            "<meta charset='utf-8'>",
-            "</head>",
-            "<body>",
-            f"<h1>{title}</h1>"
-        ]
-
-        for block in blocks:
-            block_type = block.get("type", "")
-
-            if block_type == "paragraph":
-                text = self._extract_rich_text(block.get("paragraph", {}).get("rich_text", []))
-                lines.append(f"<p>{text}</p>")
-
-            elif block_type == "heading_1":
-                text = self._extract_rich_text(block.get("heading_1", {}).get("rich_text", []))
-                lines.append(f"<h1>{text}</h1>")
-
-            elif block_type == "heading_2":
-                text = self._extract_rich_text(block.get("heading_2", {}).get("rich_text", []))
-                lines.append(f"<h2>{text}</h2>")
-
-            elif block_type == "heading_3":
-                text = self._extract_rich_text(block.get("heading_3", {}).get("rich_text", []))
-                lines.append(f"<h3>{text}</h3>")
-
-        lines.extend(["</body>", "</html>"])
-        return "\n".join(lines)
+        return _convert_blocks(title, blocks, "html")
 
     def _extract_rich_text(self, rich_text_array: List[Dict]) -> str:
         """从富文本数组中提取纯文本。"""
-        text_parts = []
-        for text_obj in rich_text_array:
-            text_parts.append(text_obj.get("plain_text", ""))
-        return "".join(text_parts)
+        return _plain_text(rich_text_array)
 
     def _create_sample_files(self, local_path: Path, remote_path: str):
         """创建示例文件来模拟下载。"""
@@ -613,24 +943,10 @@ class FileSyncWorker(QThread, LoggerMixin):
 
             # 创建示例 Markdown 文件
             md_file = local_path / "README.md"
-            self._create_sample_file(md_file, f"""# {remote_path}
-
-这是从云端下载的示例内容。
-
-## 内容说明
-
-- 这是一个示例文档
-- 来源：{remote_path}
-- 下载时间：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 功能特性
-
-1. 支持 Markdown 格式
-2. 自动同步
-3. 版本控制
-
-> 注意：这是演示内容，实际使用时会从真实的云端服务下载内容。
-""")
+            self._create_sample_file(md_file, _SAMPLE_README_TEMPLATE.format(
+                path=remote_path,
+                downloaded_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ))
 
             # 创建示例 JSON 文件
             json_file = local_path / "metadata.json"
@@ -641,11 +957,9 @@ class FileSyncWorker(QThread, LoggerMixin):
                 "files": ["README.md"]
             }
 
-            with open(json_file, 'w', encoding='utf-8') as f:
-                import json
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            json_file.write_bytes(_dumps_json_bytes(metadata))
 
-            self.file_synced.emit(str(json_file), "下载")
+            self._report_synced(str(json_file), "下载")
 
     def _create_sample_file(self, file_path: Path, content: str):
         """创建示例文件。"""
@@ -655,62 +969,81 @@ class FileSyncWorker(QThread, LoggerMixin):
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
 
-            self.file_synced.emit(str(file_path), "下载")
+            self._report_synced(str(file_path), "下载")
             self.logger.info(f"创建文件: {file_path}")
 
         except Exception as e:
             self.logger.error(f"创建文件失败 {file_path}: {e}")
             raise
     
-    def _bidirectional_sync(self, pair: SyncPair):
-        """双向同步 - 比较修改时间并决定同步方向。"""
+    def _bidirectional_sync(self, pair: SyncPair) -> bool:
+        """双向同步 - 比较修改时间并决定同步方向，返回是否成功。"""
         self.logger.info(f"双向同步 {pair.local_path} <-> {pair.remote_path}")
 
+        # 本地文件只 stat 一次，后续都使用其中的纳秒级修改时间
+        try:
+            local_stat: Optional[os.stat_result] = pair.local_path.stat()
+        except OSError:
+            local_stat = None
+
+        # 快速路径：本地文件大小和修改时间与上次同步时一致且刚同步过，不再请求远程信息
+        if local_stat is not None and self._can_skip_remote_check(pair, local_stat):
+            self.logger.info("本地文件未变化，跳过远程检查")
+            self._report_synced(str(pair.local_path), "已同步")
+            return True
+
         try:
             # 获取本地文件信息
-            local_exists = pair.local_path.exists()
-            local_mtime = None
-            if local_exists:
-                local_mtime = datetime.fromtimestamp(pair.local_path.stat().st_mtime)
+            local_exists = local_stat is not None
+            local_mtime_ns = local_stat.st_mtime_ns if local_stat else None
 
             # 获取远程文件信息
             remote_info = self._get_remote_file_info(pair.remote_path)
             remote_exists = remote_info is not None
-            remote_mtime = None
+            remote_mtime_ns = None
             if remote_exists and remote_info:
-                remote_mtime = self._parse_notion_datetime(remote_info.get("last_edited_time"))
+                remote_mtime_ns = self._parse_notion_datetime(remote_info.get("last_edited_time"))
 
             # 决定同步方向
             sync_direction = self._determine_sync_direction(
-                local_exists, local_mtime,
-                remote_exists, remote_mtime,
-                pair.last_sync
+                local_exists, local_mtime_ns,
+                remote_exists, remote_mtime_ns,
+                _datetime_to_ns(pair.last_sync) if pair.last_sync else None
             )
 
             # 执行同步
+            success = True
             if sync_direction == "local_to_remote":
                 self.logger.info("本地文件较新，上传到远程")
-                self._upload_to_remote(pair)
+                success = self._upload_to_remote(pair)
 
             elif sync_direction == "remote_to_local":
                 self.logger.info("远程文件较新，下载到本地")
-                self._download_from_remote(pair)
+                success = self._download_from_remote(pair)
 
             elif sync_direction == "conflict":
                 self.logger.warning("检测到冲突，创建备份")
-                self._handle_sync_conflict(pair)
+                success = self._handle_sync_conflict(pair)
 
             else:  # no_change
                 self.logger.info("文件已同步，无需更新")
 
-            self.file_synced.emit(str(pair.local_path), "双向同步")
+            if success:
+                self._report_synced(str(pair.local_path), "双向同步")
+            return success
 
         except Exception as e:
             self.logger.error(f"双向同步失败: {e}")
             raise
 
     def _get_remote_file_info(self, remote_path: str) -> Optional[Dict]:
-        """获取远程文件信息。"""
+        """获取远程文件信息，优先使用 run() 开始时预取的结果。"""
+        if remote_path in self._remote_infos:
+            return self._remote_infos.pop(remote_path)
+        return self._fetch_remote_file_info(remote_path)
+
+    def _fetch_remote_file_info(self, remote_path: str) -> Optional[Dict]:
+        """请求远程文件信息。"""
         try:
             notion_client = self._get_notion_client()
             if not notion_client:
@@ -721,6 +1054,7 @@ class FileSyncWorker(QThread, LoggerMixin):
                 return None
 
             # 获取页面基本信息（不包含内容）
+            self._rate_limiter.acquire()
             page_info = notion_client._make_request("GET", f"/pages/{page_id}")
             return page_info
 
@@ -728,22 +1062,22 @@ class FileSyncWorker(QThread, LoggerMixin):
             self.logger.error(f"获取远程文件信息失败: {e}")
             return None
 
-    def _parse_notion_datetime(self, datetime_str: str) -> Optional[datetime]:
-        """解析 Notion 的日期时间字符串。"""
+    def _parse_notion_datetime(self, datetime_str: str) -> Optional[int]:
+        """解析 Notion 的日期时间字符串，返回纪元以来的纳秒数。"""
         try:
             if not datetime_str:
                 return None
             # Notion 使用 ISO 8601 格式
-            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+            return _datetime_to_ns(datetime.fromisoformat(datetime_str.replace('Z', '+00:00')))
         except Exception as e:
             self.logger.error(f"解析日期时间失败: {e}")
             return None
 
     def _determine_sync_direction(self,
-                                local_exists: bool, local_mtime: Optional[datetime],
-                                remote_exists: bool, remote_mtime: Optional[datetime],
-                                last_sync: Optional[datetime]) -> str:
-        """确定同步方向。"""
+                                local_exists: bool, local_mtime: Optional[int],
+                                remote_exists: bool, remote_mtime: Optional[int],
+                                last_sync: Optional[int]) -> str:
+        """确定同步方向（时间均为纪元以来的纳秒整数）。"""
 
         # 如果只有一边存在，同步到另一边
         if local_exists and not remote_exists:
@@ -754,9 +1088,9 @@ class FileSyncWorker(QThread, LoggerMixin):
             return "no_change"
 
         # 两边都存在，比较修改时间
-        if local_mtime and remote_mtime:
+        if local_mtime is not None and remote_mtime is not None:
             # 如果有上次同步时间，检查是否有冲突
-            if last_sync:
+            if last_sync is not None:
                 local_changed = local_mtime > last_sync
                 remote_changed = remote_mtime > last_sync
 
@@ -780,23 +1114,23 @@ class FileSyncWorker(QThread, LoggerMixin):
 
         return "no_change"
 
-    def _handle_sync_conflict(self, pair: SyncPair):
-        """处理同步冲突。"""
+    def _handle_sync_conflict(self, pair: SyncPair) -> bool:
+        """处理同步冲突，返回远程版本是否下载成功。"""
         try:
             # 创建本地文件的备份
             if pair.local_path.exists():
                 backup_path = pair.local_path.with_suffix(
                     f".backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}{pair.local_path.suffix}"
                 )
-                import shutil
                 shutil.copy2(pair.local_path, backup_path)
                 self.logger.info(f"创建本地备份: {backup_path}")
 
             # 下载远程版本，用户可以手动合并
-            self._download_from_remote(pair)
+            success = self._download_from_remote(pair)
 
             # 发出冲突警告
             self.error_occurred.emit(f"检测到同步冲突: {pair.local_path.name}，已创建备份文件")
+            return success
 
         except Exception as e:
             self.logger.error(f"处理同步冲突失败: {e}")
@@ -812,12 +1146,16 @@ class FileSyncService(QObject, LoggerMixin):
     sync_completed = Signal(bool, str)
     sync_error = Signal(str)
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, database_manager=None):
         super().__init__()
         self.config_manager = config_manager
+        # 提供数据库时启用持久化的文件哈希缓存
+        self.hash_cache = HashCache(database_manager) if database_manager else None
         self.sync_pairs: List[SyncPair] = []
         self.sync_worker: Optional[FileSyncWorker] = None
         self.is_syncing = False
+        # 由 SyncBridge 注入，创建同步工作线程时传入
+        self.notion_client = None
         
         # 加载同步对
         self._load_sync_pairs()
@@ -847,6 +1185,10 @@ class FileSyncService(QObject, LoggerMixin):
             self.logger.error(f"移除同步对失败: {e}")
             return False
     
+    def set_notion_client(self, notion_client):
+        """设置同步时使用的 Notion 客户端。"""
+        self.notion_client = notion_client
+    
     def get_sync_pairs(self) -> List[SyncPair]:
         """获取所有同步对。"""
         return self.sync_pairs.copy()
@@ -865,7 +1207,8 @@ class FileSyncService(QObject, LoggerMixin):
         self.sync_started.emit()
         
         # 创建并启动同步工作线程
-        self.sync_worker = FileSyncWorker(self.sync_pairs, sync_mode)
+        self.sync_worker = FileSyncWorker(self.sync_pairs, sync_mode, hash_cache=self.hash_cache,
+                                          notion_client=self.notion_client)
         self.sync_worker.progress_updated.connect(self.sync_progress.emit)
         self.sync_worker.sync_completed.connect(self._on_sync_completed)
         self.sync_worker.error_occurred.connect(self.sync_error.emit)
@@ -3,14 +3,98 @@
 """
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Callable, Optional
+from typing import Dict, Iterator, List, Set, Callable, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
 from PySide6.QtCore import QObject, Signal, QTimer, QThread
 from notion_sync.utils.logging_config import LoggerMixin
+from notion_sync.utils.checksum import file_checksum
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+_SUPPORTED_EXTENSIONS = frozenset({'.md', '.txt', '.json', '.html', '.py', '.js', '.css'})
+
+# 预先放入全大写形式，常见文件名无需 lower() 即可命中
+_EXTENSION_LOOKUP = _SUPPORTED_EXTENSIONS | frozenset(ext.upper() for ext in _SUPPORTED_EXTENSIONS)
+
+# 文件状态: (st_size, st_mtime_ns)；用元组而非字典，每个文件只占一个小对象
+FileState = Tuple[int, int]
+
+_IGNORE_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.vscode'})
+
+# 初始扫描的并发线程数；stat/scandir 会释放 GIL
+_SCAN_WORKERS = 8
+
+# 目录 mtime 的最粗精度（FAT 为 2 秒，部分网络盘类似）；mtime 落在扫描时刻此窗口内的目录
+# 可能在同一时间片内又新增了条目而 mtime 不变，下次轮询仍需重新扫描（同 git 的 racy 处理）
+_DIR_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# 对所有文件做完整 stat（用于发现原地修改）的最长间隔（秒），实际取 max(此值, 基础轮询间隔)；
+# 按时间而非轮询次数计算，空闲退避拉长轮询间隔后原地修改仍能在一次轮询内被发现
+_FULL_CHECK_INTERVAL = 2.0
+
+# 合并突发文件变化的时间窗口（毫秒）
+_BATCH_WINDOW_MS = 200
+
+# 空闲时轮询间隔的增长倍数与默认上限（秒）
+_IDLE_BACKOFF = 1.5
+_MAX_POLL_INTERVAL = 30.0
+
+
+def _collapse_watch_paths(paths: List[Path]) -> List[Path]:
+    """去掉已被其他监控路径包含的路径，避免重叠子树被重复扫描或重复上报。"""
+    roots: List[Path] = []
+    for path in sorted(paths, key=lambda p: len(p.parts)):
+        if not any(path == root or root in path.parents for root in roots):
+            roots.append(path)
+    return roots
+
+
+def _is_within(path: str, roots: List[str]) -> bool:
+    """判断字符串路径是否等于或位于某个根目录之下。"""
+    return any(path == root or path.startswith(root + os.sep) for root in roots)
+
+
+def _should_monitor_name(name: str) -> bool:
+    """只根据文件名判断是否应该监控；目录过滤由调用方在遍历时完成。"""
+    # 检查文件扩展名
+    dot = name.rfind('.')
+    if dot < 0:
+        return False
+    ext = name[dot:]
+    if ext not in _EXTENSION_LOOKUP and ext.lower() not in _SUPPORTED_EXTENSIONS:
+        return False
+    
+    # 忽略隐藏文件和临时文件
+    if name.startswith('.') or name.startswith('~'):
+        return False
+    
+    return True
+
+
+def _should_monitor_file(file_path: Path) -> bool:
+    """判断是否应该监控此文件。"""
+    if not _should_monitor_name(file_path.name):
+        return False
+    
+    # 忽略特定目录
+    if not _IGNORE_DIRS.isdisjoint(file_path.parts):
+        return False
+    
+    return True
 
 
 class FileChangeType(Enum):
@@ -34,91 +118,297 @@ class FileChangeEvent:
         return f"FileChangeEvent({self.change_type.value}: {self.path})"
 
 
+# _ContentTracker 中表示“文件已删除、没有可用基线”的记录
+_DELETED = None
+
+
+class _ContentTracker:
+    """记录文件最近一次的内容校验和，过滤格式化工具、git checkout 等原样重写造成的事件。
+    
+    watchdog 事件处理器和轮询工作线程共用同一个实例，会在不同线程中调用。
+    文件没有记录时以哈希缓存中最近一次的校验和（通常来自上次同步）为基线。
+    """
+    
+    def __init__(self, hash_cache=None):
+        self._hash_cache = hash_cache
+        self._checksums: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+    
+    def content_changed(self, file_path: str) -> bool:
+        """重新计算校验和并与基线比较；没有基线或无法读取时视为已变化。"""
+        try:
+            stat = os.stat(file_path)
+            new_hash = file_checksum(file_path)
+        except OSError:
+            return True
+        
+        with self._lock:
+            if file_path in self._checksums:
+                old_hash = self._checksums[file_path]
+            elif self._hash_cache is not None:
+                old_hash = self._hash_cache.last_checksum(file_path)
+            else:
+                old_hash = None
+            self._checksums[file_path] = new_hash
+        
+        if self._hash_cache is not None:
+            self._hash_cache.put(file_path, stat, new_hash)
+        return old_hash != new_hash
+    
+    def forget(self, file_path: str):
+        """文件已删除：之后同路径的新文件不能再以旧内容为基线。"""
+        with self._lock:
+            self._checksums[file_path] = _DELETED
+
+
+class _WatchdogEventHandler(FileSystemEventHandler):
+    """把 watchdog 的系统事件转换为 FileChangeEvent。"""
+    
+    def __init__(self, emit: Callable[[FileChangeEvent], None], only_path: Optional[Path] = None,
+                 content_tracker: Optional[_ContentTracker] = None):
+        super().__init__()
+        self._emit = emit
+        # 监控单个文件时只能监听其父目录，用它过滤掉同目录的其他文件
+        self._only_path = only_path
+        self._content_tracker = content_tracker
+    
+    def _accepts(self, file_path: Path) -> bool:
+        if self._only_path is not None and file_path != self._only_path:
+            return False
+        return _should_monitor_file(file_path)
+    
+    def _dispatch(self, path: str, change_type: FileChangeType):
+        file_path = Path(path)
+        if self._accepts(file_path):
+            self._emit_checked(file_path, change_type)
+    
+    def _emit_checked(self, file_path: Path, change_type: FileChangeType):
+        """发送事件；创建和修改事件在内容与基线相同时丢弃。"""
+        tracker = self._content_tracker
+        if tracker is not None:
+            if change_type is FileChangeType.DELETED:
+                tracker.forget(str(file_path))
+            elif not tracker.content_changed(str(file_path)):
+                return
+        self._emit(FileChangeEvent(file_path, change_type))
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._dispatch(event.src_path, FileChangeType.CREATED)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._dispatch(event.src_path, FileChangeType.MODIFIED)
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._dispatch(event.src_path, FileChangeType.DELETED)
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+        
+        src_path = Path(event.src_path)
+        dest_path = Path(event.dest_path)
+        src_monitored = self._accepts(src_path)
+        dest_monitored = self._accepts(dest_path)
+        
+        if src_monitored and dest_monitored:
+            if self._content_tracker is not None:
+                self._content_tracker.forget(str(src_path))
+            change = FileChangeEvent(dest_path, FileChangeType.MOVED)
+            change.old_path = src_path
+            self._emit(change)
+        elif src_monitored:
+            # 移出监控范围（例如重命名为临时文件）视为删除
+            self._emit_checked(src_path, FileChangeType.DELETED)
+        elif dest_monitored:
+            # 编辑器常见的“写临时文件再重命名”保存方式；内容未变的保存会被过滤
+            self._emit_checked(dest_path, FileChangeType.CREATED)
+
+
 class FileWatcherWorker(QThread, LoggerMixin):
     """文件监控工作线程。"""
     
     # 信号
     file_changed = Signal(object)  # FileChangeEvent
     
-    def __init__(self, watch_paths: List[Path], poll_interval: float = 1.0):
+    def __init__(self, watch_paths: List[Path], poll_interval: float = 1.0,
+                 max_poll_interval: float = _MAX_POLL_INTERVAL,
+                 snapshot: Optional[Tuple[List[Path], Dict, Dict]] = None,
+                 content_tracker: Optional[_ContentTracker] = None):
         super().__init__()
-        self.watch_paths = watch_paths
+        self.watch_paths = _collapse_watch_paths(watch_paths)
         self.poll_interval = poll_interval
-        self.should_stop = False
-        self.file_states: Dict[Path, Dict] = {}
-        self.supported_extensions = {'.md', '.txt', '.json', '.html', '.py', '.js', '.css'}
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self._events_emitted = 0
+        self._stop_event = threading.Event()
+        # 以字符串路径为键，只在发送事件时才构造 Path
+        self.file_states: Dict[str, FileState] = {}
+        # 目录 -> (st_mtime_ns, 子目录, 待监控文件, 是否处于 mtime 精度窗口内)；
+        # 目录 mtime 不变且不在窗口内说明其条目未增删
+        self.dir_cache: Dict[str, Tuple[int, List[str], List[str], bool]] = {}
+        self.supported_extensions = _SUPPORTED_EXTENSIONS
+        self._last_full_check = 0.0
+        # 与 watchdog 事件处理器共用的内容校验和记录，用于过滤原样重写
+        self.content_tracker = content_tracker
         
         # 初始化文件状态
-        self._initialize_file_states()
+        self._initialize_file_states(snapshot)
+    
+    def snapshot(self) -> Tuple[List[Path], Dict, Dict]:
+        """导出 (已扫描的根路径, 文件状态, 目录缓存)，供重启后的工作线程沿用。"""
+        return self.watch_paths, self.file_states, self.dir_cache
+    
+    @property
+    def should_stop(self) -> bool:
+        """是否已请求停止。"""
+        return self._stop_event.is_set()
     
     def stop(self):
-        """停止监控。"""
-        self.should_stop = True
+        """停止监控；正在进行的等待会立即返回。"""
+        self._stop_event.set()
     
     def run(self):
         """运行监控循环。"""
         self.logger.info(f"开始监控 {len(self.watch_paths)} 个路径")
         
+        # 空闲时逐步拉长间隔，一旦检测到变化立即恢复最小间隔
+        interval = self.poll_interval
         while not self.should_stop:
             try:
+                emitted = self._events_emitted
                 self._check_for_changes()
-                self.msleep(int(self.poll_interval * 1000))
+                if self._events_emitted != emitted:
+                    interval = self.poll_interval
+                else:
+                    interval = min(interval * _IDLE_BACKOFF, self.max_poll_interval)
+                self._stop_event.wait(interval)
             except Exception as e:
                 self.logger.error(f"文件监控错误: {e}")
-                self.msleep(5000)  # 错误时等待5秒
+                self._stop_event.wait(5.0)  # 错误时等待5秒
     
-    def _initialize_file_states(self):
-        """初始化文件状态。"""
-        for watch_path in self.watch_paths:
-            if watch_path.exists():
-                self._scan_directory(watch_path)
+    def _initialize_file_states(self, snapshot: Optional[Tuple[List[Path], Dict, Dict]] = None):
+        """初始化文件状态；多个监控路径并行扫描，结果在主线程合并。
+        
+        传入上一个工作线程的快照时，沿用仍在监控范围内的状态，只扫描新增的路径。
+        """
+        paths = [path for path in self.watch_paths if path.exists()]
+        if snapshot is not None:
+            known_roots, file_states, dir_cache = snapshot
+            roots = [str(path) for path in self.watch_paths]
+            self.file_states = {
+                path: state for path, state in file_states.items() if _is_within(path, roots)
+            }
+            self.dir_cache = {
+                path: entry for path, entry in dir_cache.items() if _is_within(path, roots)
+            }
+            paths = [
+                path for path in paths
+                if not any(path == root or root in path.parents for root in known_roots)
+            ]
+        
+        if len(paths) <= 1:
+            results = map(self._scan_directory, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(paths))) as executor:
+                results = list(executor.map(self._scan_directory, paths))
+        
+        for states, dir_cache in results:
+            self.file_states.update(states)
+            self.dir_cache.update(dir_cache)
     
-    def _scan_directory(self, directory: Path):
-        """扫描目录并记录文件状态。"""
+    def _scan_directory(self, directory: Path) -> Tuple[Dict[str, FileState], Dict]:
+        """扫描目录，返回其中文件的状态和目录缓存；可在扫描线程中调用，不修改共享状态。"""
+        states: Dict[str, FileState] = {}
+        dir_cache: Dict[str, Tuple[int, List[str], List[str], bool]] = {}
         try:
             if directory.is_file():
-                self._record_file_state(directory)
-                return
+                items = [str(directory)]
+            else:
+                items = (
+                    item
+                    for _, files in self._walk_monitored_dirs(directory, dir_cache)
+                    for item in files
+                )
             
-            for item in directory.rglob("*"):
-                if item.is_file() and self._should_monitor_file(item):
-                    self._record_file_state(item)
+            for item in items:
+                state = self._read_file_state(item)
+                if state is not None:
+                    states[item] = state
                     
         except Exception as e:
             self.logger.error(f"扫描目录失败 {directory}: {e}")
+        return states, dir_cache
     
-    def _should_monitor_file(self, file_path: Path) -> bool:
-        """判断是否应该监控此文件。"""
-        # 检查文件扩展名
-        if file_path.suffix.lower() not in self.supported_extensions:
-            return False
+    def _walk_monitored_dirs(self, directory: Path,
+                             dir_cache: Optional[Dict] = None) -> Iterator[Tuple[bool, List[str]]]:
+        """逐个目录产出 (目录是否有变化, 待监控文件)；只有 mtime 变化的目录才会重新 scandir。
         
-        # 忽略隐藏文件和临时文件
-        if file_path.name.startswith('.') or file_path.name.startswith('~'):
-            return False
-        
-        # 忽略特定目录
-        ignore_dirs = {'.git', '__pycache__', 'node_modules', '.vscode'}
-        if any(part in ignore_dirs for part in file_path.parts):
-            return False
+        dir_cache 默认为 self.dir_cache；并行的初始扫描各自传入独立的字典。
+        """
+        if dir_cache is None:
+            dir_cache = self.dir_cache
+        if not _IGNORE_DIRS.isdisjoint(directory.parts):
+            return
         
-        return True
+        stack = [str(directory)]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                mtime_ns = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                dir_cache.pop(dir_path, None)
+                continue
+            
+            cached = dir_cache.get(dir_path)
+            changed = cached is None or cached[0] != mtime_ns or cached[3]
+            if not changed:
+                _, subdirs, files, _ = cached
+            else:
+                subdirs, files = [], []
+                scan_ns = time.time_ns()
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in _IGNORE_DIRS:
+                                    subdirs.append(entry.path)
+                            elif entry.is_file() and _should_monitor_name(entry.name):
+                                files.append(entry.path)
+                except OSError as e:
+                    self.logger.error(f"读取目录失败 {dir_path}: {e}")
+                    continue
+                if cached is not None:
+                    # 已删除的子目录不会再被访问，顺手清掉它们的缓存
+                    for removed in set(cached[1]).difference(subdirs):
+                        dir_cache.pop(removed, None)
+                racy = mtime_ns >= scan_ns - _DIR_MTIME_GRANULARITY_NS
+                dir_cache[dir_path] = (mtime_ns, subdirs, files, racy)
+            
+            yield changed, files
+            stack.extend(subdirs)
+    
+    def _should_monitor_file(self, file_path: Path) -> bool:
+        """判断是否应该监控此文件。"""
+        return _should_monitor_file(file_path)
     
-    def _record_file_state(self, file_path: Path):
-        """记录文件状态。"""
+    def _read_file_state(self, file_path: str) -> Optional[FileState]:
+        """读取文件状态，不修改任何实例状态。"""
         try:
-            stat = file_path.stat()
-            self.file_states[file_path] = {
-                'size': stat.st_size,
-                'mtime': stat.st_mtime,
-                'exists': True
-            }
+            stat = os.stat(file_path)
+            return (stat.st_size, stat.st_mtime_ns)
         except Exception as e:
             self.logger.error(f"记录文件状态失败 {file_path}: {e}")
+            return None
     
     def _check_for_changes(self):
         """检查文件变化。"""
         current_files = set()
+        now = time.monotonic()
+        full_check = now - self._last_full_check >= max(_FULL_CHECK_INTERVAL, self.poll_interval)
+        if full_check:
+            self._last_full_check = now
         
         # 扫描当前文件
         for watch_path in self.watch_paths:
@@ -128,50 +418,55 @@ class FileWatcherWorker(QThread, LoggerMixin):
             try:
                 if watch_path.is_file():
                     if self._should_monitor_file(watch_path):
-                        current_files.add(watch_path)
-                        self._check_file_changes(watch_path)
+                        file_path = str(watch_path)
+                        current_files.add(file_path)
+                        self._check_file_changes(file_path)
                 else:
-                    for item in watch_path.rglob("*"):
-                        if item.is_file() and self._should_monitor_file(item):
-                            current_files.add(item)
-                            self._check_file_changes(item)
+                    # 目录 mtime 未变说明没有增删文件，只在完整检查时才逐个 stat；
+                    # 原地修改不会改变目录 mtime，最迟在下一次完整检查时发现
+                    for changed, files in self._walk_monitored_dirs(watch_path):
+                        current_files.update(files)
+                        if changed or full_check:
+                            for item in files:
+                                self._check_file_changes(item)
             except Exception as e:
                 self.logger.error(f"检查路径变化失败 {watch_path}: {e}")
         
         # 检查删除的文件
-        deleted_files = set(self.file_states.keys()) - current_files
+        deleted_files = self.file_states.keys() - current_files
         for deleted_file in deleted_files:
             self._emit_change_event(deleted_file, FileChangeType.DELETED)
             del self.file_states[deleted_file]
+            if self.content_tracker is not None:
+                self.content_tracker.forget(deleted_file)
     
-    def _check_file_changes(self, file_path: Path):
+    def _check_file_changes(self, file_path: str):
         """检查单个文件的变化。"""
         try:
-            stat = file_path.stat()
-            current_state = {
-                'size': stat.st_size,
-                'mtime': stat.st_mtime,
-                'exists': True
-            }
+            stat = os.stat(file_path)
+            old_state = self.file_states.get(file_path)
             
-            if file_path not in self.file_states:
+            if old_state is None:
                 # 新文件
-                self.file_states[file_path] = current_state
-                self._emit_change_event(file_path, FileChangeType.CREATED)
-            else:
-                # 检查修改
-                old_state = self.file_states[file_path]
-                if (current_state['size'] != old_state['size'] or 
-                    current_state['mtime'] != old_state['mtime']):
-                    self.file_states[file_path] = current_state
-                    self._emit_change_event(file_path, FileChangeType.MODIFIED)
+                self.file_states[file_path] = (stat.st_size, stat.st_mtime_ns)
+                self._emit_if_content_changed(file_path, FileChangeType.CREATED)
+            elif stat.st_size != old_state[0] or stat.st_mtime_ns != old_state[1]:
+                # 检查修改；原样重写时只刷新记录的 mtime
+                self.file_states[file_path] = (stat.st_size, stat.st_mtime_ns)
+                self._emit_if_content_changed(file_path, FileChangeType.MODIFIED)
                     
         except Exception as e:
             self.logger.error(f"检查文件变化失败 {file_path}: {e}")
     
-    def _emit_change_event(self, file_path: Path, change_type: FileChangeType):
+    def _emit_if_content_changed(self, file_path: str, change_type: FileChangeType):
+        """内容与基线不同（或无法判断）时才发送事件。"""
+        if self.content_tracker is None or self.content_tracker.content_changed(file_path):
+            self._emit_change_event(file_path, change_type)
+    
+    def _emit_change_event(self, file_path: str, change_type: FileChangeType):
         """发送文件变化事件。"""
-        event = FileChangeEvent(file_path, change_type)
+        event = FileChangeEvent(Path(file_path), change_type)
+        self._events_emitted += 1
         self.file_changed.emit(event)
         self.logger.debug(f"文件变化: {event}")
 
@@ -181,13 +476,32 @@ class FileWatcher(QObject, LoggerMixin):
     
     # 信号
     file_changed = Signal(object)  # FileChangeEvent
+    files_changed = Signal(list)  # List[FileChangeEvent]，按时间窗口合并、每个路径只保留最新事件
+    # watchdog 回调在观察者线程中触发，经由此信号排队回到所属线程
+    _observed_change = Signal(object)  # FileChangeEvent
     
-    def __init__(self):
+    def __init__(self, hash_cache=None, use_polling: bool = False):
         super().__init__()
         self.watch_paths: List[Path] = []
+        # 两种监控方式共用的内容校验和记录；hash_cache 为文件同步服务的 HashCache，可为 None
+        self._content_tracker = _ContentTracker(hash_cache)
+        # 默认使用 watchdog 的系统事件；网络盘、SMB 等收不到系统事件的路径可改用轮询，
+        # 未安装 watchdog 时总是轮询
+        self.use_polling = use_polling
         self.worker: Optional[FileWatcherWorker] = None
+        self.observer = None
         self.is_watching = False
-        self.poll_interval = 1.0  # 轮询间隔（秒）
+        self.poll_interval = 1.0  # 轮询间隔（秒），仅轮询模式使用
+        self.max_poll_interval = _MAX_POLL_INTERVAL  # 空闲时轮询间隔上限（秒）
+        self._poll_snapshot: Optional[Tuple[List[Path], Dict, Dict]] = None
+        self._observed_change.connect(self._on_file_changed)
+        
+        # 突发变化（如格式化整个项目）先缓冲，窗口结束后一次性发出
+        self._pending_changes: Dict[Path, FileChangeEvent] = {}
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(_BATCH_WINDOW_MS)
+        self._batch_timer.timeout.connect(self._flush_changes)
     
     def add_watch_path(self, path: str) -> bool:
         """添加监控路径。"""
@@ -238,28 +552,60 @@ class FileWatcher(QObject, LoggerMixin):
             return False
         
         try:
-            self.worker = FileWatcherWorker(self.watch_paths, self.poll_interval)
-            self.worker.file_changed.connect(self._on_file_changed)
-            self.worker.start()
+            if WATCHDOG_AVAILABLE and not self.use_polling:
+                self._start_observer()
+                self.logger.info("文件监控已启动（系统事件）")
+            else:
+                self.worker = FileWatcherWorker(self.watch_paths, self.poll_interval,
+                                                self.max_poll_interval, self._poll_snapshot,
+                                                content_tracker=self._content_tracker)
+                self._poll_snapshot = None
+                self.worker.file_changed.connect(self._on_file_changed)
+                self.worker.start()
+                self.logger.info("文件监控已启动（轮询）")
             
             self.is_watching = True
-            self.logger.info("文件监控已启动")
             return True
             
         except Exception as e:
             self.logger.error(f"启动文件监控失败: {e}")
             return False
     
+    def _start_observer(self):
+        """使用 inotify/FSEvents/ReadDirectoryChangesW 监听监控路径。"""
+        emit = self._observed_change.emit
+        observer = Observer()
+        for path in _collapse_watch_paths(self.watch_paths):
+            if path.is_dir():
+                handler = _WatchdogEventHandler(emit, content_tracker=self._content_tracker)
+                observer.schedule(handler, str(path), recursive=True)
+            else:
+                handler = _WatchdogEventHandler(emit, path, self._content_tracker)
+                observer.schedule(handler, str(path.parent), recursive=False)
+        observer.start()
+        self.observer = observer
+    
     def stop_watching(self):
         """停止监控。"""
         if not self.is_watching:
             return
         
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(5)  # 等待最多5秒
+            self.observer = None
+        
         if self.worker:
             self.worker.stop()
             self.worker.wait(5000)  # 等待最多5秒
+            # 保留已扫描的状态，重启时只需扫描新增路径
+            self._poll_snapshot = self.worker.snapshot()
             self.worker = None
         
+        if self._batch_timer.isActive():
+            self._batch_timer.stop()
+            self._flush_changes()
+        
         self.is_watching = False
         self.logger.info("文件监控已停止")
     
@@ -269,11 +615,22 @@ class FileWatcher(QObject, LoggerMixin):
         time.sleep(0.1)  # 短暂等待
         self.start_watching()
     
-    def set_poll_interval(self, interval: float):
-        """设置轮询间隔。"""
+    def set_use_polling(self, use_polling: bool):
+        """切换轮询与系统事件两种监控方式，正在监控时立即重启生效。"""
+        if use_polling == self.use_polling:
+            return
+        self.use_polling = use_polling
+        if self.is_watching:
+            self.restart_watching()
+    
+    def set_poll_interval(self, interval: float, max_interval: Optional[float] = None):
+        """设置轮询间隔；空闲时间隔会逐步增长到 max_interval。"""
         self.poll_interval = max(0.1, interval)  # 最小0.1秒
+        if max_interval is not None:
+            self.max_poll_interval = max(self.poll_interval, max_interval)
         
-        if self.is_watching:
+        # 系统事件模式不使用轮询间隔，无需重启
+        if self.is_watching and self.worker:
             self.restart_watching()
     
     def get_watch_paths(self) -> List[str]:
@@ -284,6 +641,20 @@ class FileWatcher(QObject, LoggerMixin):
         """处理文件变化事件。"""
         self.file_changed.emit(event)
         self.logger.info(f"检测到文件变化: {event}")
+        
+        # 同一路径在窗口内的多次变化只保留最后一次
+        self._pending_changes.pop(event.path, None)
+        self._pending_changes[event.path] = event
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
+    
+    def _flush_changes(self):
+        """发出缓冲的文件变化批次。"""
+        if not self._pending_changes:
+            return
+        events = list(self._pending_changes.values())
+        self._pending_changes = {}
+        self.files_changed.emit(events)
     
     def clear_watch_paths(self):
         """清除所有监控路径。"""
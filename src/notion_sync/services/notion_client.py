@@ -2,16 +2,40 @@
 Notion API 客户端 - 实现与 Notion API 的交互。
 """
 
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import time
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QThread
 from notion_sync.utils.logging_config import LoggerMixin
+from notion_sync.utils.rate_limiter import RateLimiter
 from notion_sync.utils.smart_cache import get_notion_cache, get_global_cache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _dumps_body = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps_body(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
+
+# 标题属性最常见的名称：普通页面为 "title"，数据库条目默认为 "Name"
+_TITLE_KEYS = ("title", "Name", "Title")
+
 
 class NotionPage:
     """Notion 页面类。"""
@@ -30,12 +54,23 @@ class NotionPage:
         """提取页面标题。"""
         properties = data.get("properties", {})
         
-        # 查找标题属性
-        for prop_name, prop_data in properties.items():
-            if prop_data.get("type") == "title":
-                title_array = prop_data.get("title", [])
-                if title_array:
-                    return title_array[0].get("plain_text", "无标题页面")
+        # 先按常见名称直接查找，找不到再遍历所有属性
+        title_prop = None
+        for key in _TITLE_KEYS:
+            prop_data = properties.get(key)
+            if prop_data is not None and prop_data.get("type") == "title":
+                title_prop = prop_data
+                break
+        else:
+            title_prop = next(
+                (prop_data for prop_data in properties.values() if prop_data.get("type") == "title"),
+                None,
+            )
+        
+        if title_prop:
+            title_array = title_prop.get("title", [])
+            if title_array:
+                return title_array[0].get("plain_text", "无标题页面")
         
         return "无标题页面"
     
@@ -82,6 +117,18 @@ class NotionDatabase:
         }
 
 
+class WorkspaceLoadWorker(QThread):
+    """后台加载工作区：分页请求和页面对象构建都不占用界面线程。"""
+    
+    def __init__(self, client: "NotionClient"):
+        super().__init__()
+        self.client = client
+    
+    def run(self):
+        """加载工作区；结果通过 NotionClient.workspace_loaded 信号送回。"""
+        self.client.load_workspace()
+
+
 class NotionClient(QObject, LoggerMixin):
     """Notion API 客户端。"""
     
@@ -101,10 +148,39 @@ class NotionClient(QObject, LoggerMixin):
         self.connected = False
         self.workspace_info = {}
         self.rate_limit_delay = 0.5  # 速率限制延迟（秒）
+        # 分页请求共享的限速器：只在两次请求间隔不足时等待，而非每页固定休眠
+        self._search_rate_limiter = RateLimiter(1.0 / self.rate_limit_delay)
+        
+        # 每个线程一个 Session：requests.Session 不保证线程安全，
+        # 上传线程池和分页线程各自复用自己的连接
+        self._thread_local = threading.local()
 
         # 初始化缓存
         self.notion_cache = get_notion_cache()
         self.global_cache = get_global_cache()
+        
+        # 上一次列出的页面/数据库对象，按 ID 索引；last_edited_time 未变时直接复用
+        self._pages_by_id: Dict[str, NotionPage] = {}
+        self._databases_by_id: Dict[str, NotionDatabase] = {}
+        self._workspace_loader: Optional[WorkspaceLoadWorker] = None
+    
+    @property
+    def session(self) -> requests.Session:
+        """当前线程的 HTTP 会话，首次使用时创建。"""
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            # 复用 TCP/TLS 连接；瞬时的 5xx 错误对幂等请求（GET 等）自动重试，
+            # 429 仍由 _make_request 自行处理
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.5,
+                                  status_forcelist=(500, 502, 503, 504), raise_on_status=False),
+            )
+            session.mount("https://", adapter)
+            self._thread_local.session = session
+        return session
     
     def set_api_token(self, token: str) -> bool:
         """设置 API 令牌。"""
@@ -149,13 +225,22 @@ class NotionClient(QObject, LoggerMixin):
         self.headers["Authorization"] = ""
         self.connected = False
         self.workspace_info = {}
+        self._pages_by_id = {}
+        self._databases_by_id = {}
         self.connection_changed.emit(False)
         self.logger.info("已断开与 Notion 的连接")
 
+    def _workspace_cache_id(self) -> str:
+        """工作区缓存键；内置 hash() 每个进程随机化，无法跨启动命中持久缓存。"""
+        digest = hashlib.blake2s(self.api_token.encode("utf-8"), digest_size=8).hexdigest()
+        return f"workspace_{digest}"
+
     def clear_cache(self):
         """清除缓存"""
-        workspace_id = f"workspace_{hash(self.api_token)}"
+        workspace_id = self._workspace_cache_id()
         self.notion_cache.invalidate_workspace(workspace_id)
+        self._pages_by_id = {}
+        self._databases_by_id = {}
         self.logger.info("已清除 Notion 缓存")
 
     def get_page_content(self, page_id: str) -> dict:
@@ -214,13 +299,23 @@ class NotionClient(QObject, LoggerMixin):
             self.logger.error(f"获取数据库内容失败 {database_id}: {e}")
             raise e
     
+    def load_workspace_async(self) -> None:
+        """在后台线程加载工作区，完成后发出 workspace_loaded 信号。"""
+        if not self.connected:
+            return
+        if self._workspace_loader and self._workspace_loader.isRunning():
+            return
+        
+        self._workspace_loader = WorkspaceLoadWorker(self)
+        self._workspace_loader.start()
+    
     def load_workspace(self) -> Dict:
         """加载工作区信息。"""
         if not self.connected:
             return {}
 
         # 尝试从缓存获取
-        workspace_id = f"workspace_{hash(self.api_token)}"
+        workspace_id = self._workspace_cache_id()
         cached_workspace = self.notion_cache.get_workspace_data(workspace_id)
 
         if cached_workspace:
@@ -230,14 +325,16 @@ class NotionClient(QObject, LoggerMixin):
             return self.workspace_info
 
         try:
-            # 获取用户信息
-            user_info = self._make_request("GET", "/users/me")
+            # 页面和数据库是两条独立的游标链，并发分页；总请求速率由限速器控制
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pages_future = executor.submit(self.list_pages)
+                databases_future = executor.submit(self.list_databases)
 
-            # 获取页面列表
-            pages = self.list_pages()
+                # 获取用户信息
+                user_info = self._make_request("GET", "/users/me")
 
-            # 获取数据库列表
-            databases = self.list_databases()
+                pages = pages_future.result()
+                databases = databases_future.result()
 
             self.workspace_info = {
                 "user": user_info,
@@ -266,6 +363,7 @@ class NotionClient(QObject, LoggerMixin):
         
         try:
             all_pages = []
+            pages_by_id = {}
             has_more = True
             next_cursor = None
             
@@ -274,6 +372,8 @@ class NotionClient(QObject, LoggerMixin):
                 if next_cursor:
                     params["start_cursor"] = next_cursor
                 
+                # 速率限制
+                self._search_rate_limiter.acquire()
                 response = self._make_request("POST", "/search", {
                     "filter": {"property": "object", "value": "page"},
                     **params
@@ -284,14 +384,14 @@ class NotionClient(QObject, LoggerMixin):
                 
                 pages_data = response.get("results", [])
                 for page_data in pages_data:
-                    all_pages.append(NotionPage(page_data))
+                    page = self._reuse_or_build(self._pages_by_id, NotionPage, page_data)
+                    pages_by_id[page.id] = page
+                    all_pages.append(page)
                 
                 has_more = response.get("has_more", False)
                 next_cursor = response.get("next_cursor")
-                
-                # 速率限制
-                time.sleep(self.rate_limit_delay)
             
+            self._pages_by_id = pages_by_id
             self.logger.info(f"获取到 {len(all_pages)} 个页面")
             return all_pages
             
@@ -306,6 +406,7 @@ class NotionClient(QObject, LoggerMixin):
         
         try:
             all_databases = []
+            databases_by_id = {}
             has_more = True
             next_cursor = None
             
@@ -314,6 +415,8 @@ class NotionClient(QObject, LoggerMixin):
                 if next_cursor:
                     params["start_cursor"] = next_cursor
                 
+                # 速率限制
+                self._search_rate_limiter.acquire()
                 response = self._make_request("POST", "/search", {
                     "filter": {"property": "object", "value": "database"},
                     **params
@@ -324,14 +427,14 @@ class NotionClient(QObject, LoggerMixin):
                 
                 databases_data = response.get("results", [])
                 for db_data in databases_data:
-                    all_databases.append(NotionDatabase(db_data))
+                    database = self._reuse_or_build(self._databases_by_id, NotionDatabase, db_data)
+                    databases_by_id[database.id] = database
+                    all_databases.append(database)
                 
                 has_more = response.get("has_more", False)
                 next_cursor = response.get("next_cursor")
-                
-                # 速率限制
-                time.sleep(self.rate_limit_delay)
             
+            self._databases_by_id = databases_by_id
             self.logger.info(f"获取到 {len(all_databases)} 个数据库")
             return all_databases
             
@@ -339,7 +442,13 @@ class NotionClient(QObject, LoggerMixin):
             self.logger.error(f"获取数据库列表失败: {e}")
             return []
     
-
+    @staticmethod
+    def _reuse_or_build(previous: Dict[str, Any], cls, data: Dict):
+        """复用上次列出的同一版本对象，避免重复解析标题等字段。"""
+        obj = previous.get(data.get("id", ""))
+        if obj is None or obj.last_edited_time != data.get("last_edited_time", ""):
+            obj = cls(data)
+        return obj
     
     def create_page(self, parent_id: str, title: str, content: str = "") -> Optional[str]:
         """创建新页面。"""
@@ -380,20 +489,22 @@ class NotionClient(QObject, LoggerMixin):
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Optional[Dict]:
         """发送 API 请求。"""
         url = f"{self.base_url}{endpoint}"
+        # 请求头已声明 application/json，直接发送预先编码的请求体
+        body = _dumps_body(data) if data is not None else None
         
         try:
             if method == "GET":
-                response = requests.get(url, headers=self.headers, timeout=30)
+                response = self.session.get(url, headers=self.headers, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=30)
+                response = self.session.post(url, headers=self.headers, data=body, timeout=30)
             elif method == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data, timeout=30)
+                response = self.session.patch(url, headers=self.headers, data=body, timeout=30)
             else:
                 self.logger.error(f"不支持的请求方法: {method}")
                 return None
             
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
             elif response.status_code == 429:
                 # 速率限制，等待后重试
                 self.logger.warning("触发速率限制，等待重试")
@@ -2,6 +2,7 @@
 同步桥接器 - 连接 Notion API 客户端和文件同步服务。
 """
 
+import os
 from typing import Optional, Dict, Any
 from PySide6.QtCore import QObject, Signal
 
@@ -17,23 +18,34 @@ class SyncBridge(QObject, LoggerMixin):
     # 信号
     sync_status_changed = Signal(str)  # 同步状态变化
     connection_status_changed = Signal(bool)  # 连接状态变化
+    workspace_loaded = Signal(dict)  # 工作区加载完成（含后台加载）
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, database_manager=None):
         super().__init__()
         self.config_manager = config_manager
         
         # 初始化组件
         self.notion_client: Optional[NotionClient] = None
-        self.file_sync_service = FileSyncService(config_manager)
-        self.file_watcher = FileWatcher()
+        self.file_sync_service = FileSyncService(config_manager, database_manager)
+        self.file_watcher = FileWatcher(
+            self.file_sync_service.hash_cache,
+            use_polling=config_manager.get("file_watch_mode", "auto") == "polling"
+        )
+        
+        # 远程路径 -> 页面 ID；启动时读取一次，修改时写回配置
+        self._mappings: Dict[str, str] = dict(config_manager.get("remote_path_mappings", {}))
+        
+        # 规范化的本地根路径 -> 同步对；文件变化时沿父目录逐级查找，无需遍历所有同步对
+        self._pair_index: Dict[str, Any] = {}
+        self._rebuild_pair_index()
         
         # 连接信号
         self._setup_connections()
     
     def _setup_connections(self):
         """设置组件间的信号连接。"""
-        # 文件监控信号
-        self.file_watcher.file_changed.connect(self._on_file_changed)
+        # 文件监控信号：使用合并后的批量信号，突发保存只触发一次检查
+        self.file_watcher.files_changed.connect(self._on_files_changed)
         
         # 文件同步服务信号
         self.file_sync_service.sync_started.connect(
@@ -51,27 +63,12 @@ class SyncBridge(QObject, LoggerMixin):
         self.notion_client = notion_client
         
         # 将 Notion 客户端注入到文件同步服务
-        self._inject_notion_client_to_sync_service()
+        self.file_sync_service.set_notion_client(notion_client)
         
         # 连接 Notion 客户端信号
         if notion_client:
             notion_client.connection_changed.connect(self.connection_status_changed.emit)
-    
-    def _inject_notion_client_to_sync_service(self):
-        """将 Notion 客户端注入到文件同步服务。"""
-        if hasattr(self.file_sync_service, '_notion_client'):
-            self.file_sync_service._notion_client = self.notion_client
-        
-        # 为同步工作线程提供 Notion 客户端访问
-        original_get_notion_client = getattr(
-            self.file_sync_service.__class__, '_get_notion_client', None
-        )
-        
-        def get_notion_client_impl(sync_service_instance):
-            return self.notion_client
-        
-        # 动态替换方法
-        self.file_sync_service._get_notion_client = lambda: self.notion_client
+            notion_client.workspace_loaded.connect(self.workspace_loaded.emit)
     
     def connect_to_notion(self, api_token: str) -> bool:
         """连接到 Notion。"""
@@ -132,6 +129,7 @@ class SyncBridge(QObject, LoggerMixin):
         """添加同步对。"""
         success = self.file_sync_service.add_sync_pair(local_path, remote_path, sync_mode)
         if success:
+            self._rebuild_pair_index()
             # 如果启用了自动同步，添加到文件监控
             self.file_watcher.add_watch_path(local_path)
             self.logger.info(f"添加同步对: {local_path} <-> {remote_path}")
@@ -146,7 +144,9 @@ class SyncBridge(QObject, LoggerMixin):
             # 从文件监控中移除
             self.file_watcher.remove_watch_path(str(removed_pair.local_path))
         
-        return self.file_sync_service.remove_sync_pair(index)
+        success = self.file_sync_service.remove_sync_pair(index)
+        self._rebuild_pair_index()
+        return success
     
     def start_sync(self, sync_mode: str = "remote_to_local"):
         """开始导出（仅支持云端到本地）。"""
@@ -179,21 +179,46 @@ class SyncBridge(QObject, LoggerMixin):
         """检查是否正在同步。"""
         return self.file_sync_service.is_syncing
     
-    def _on_file_changed(self, event):
-        """处理文件变化事件。"""
-        self.logger.info(f"检测到文件变化: {event}")
+    def _on_files_changed(self, events: list):
+        """处理一批文件变化事件。"""
+        self.logger.info(f"检测到 {len(events)} 个文件变化")
         
         # 如果启用了自动同步，触发同步
         if self.is_connected() and not self.is_syncing():
             # 检查变化的文件是否在同步对中
-            changed_file_path = str(event.path)
-            sync_pairs = self.get_sync_pairs()
-            
-            for pair in sync_pairs:
-                if changed_file_path.startswith(str(pair.local_path)):
+            for event in events:
+                pair = self._find_sync_pair(str(event.path))
+                if pair is not None:
                     self.logger.info(f"触发自动同步: {pair.local_path}")
                     self.start_sync(pair.sync_mode)
-                    break
+                    return
+    
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """规范化路径，使前缀比较不受大小写（Windows）和多余分隔符影响。"""
+        return os.path.normcase(os.path.normpath(path))
+    
+    def _rebuild_pair_index(self):
+        """同步对增删后重建本地路径索引。"""
+        self._pair_index = {}
+        for pair in self.file_sync_service.get_sync_pairs():
+            # 与原先按列表顺序取第一个匹配一致：同一路径保留先出现的同步对
+            self._pair_index.setdefault(self._normalize_path(str(pair.local_path)), pair)
+    
+    def _find_sync_pair(self, file_path: str):
+        """查找包含该文件的同步对（最深的本地根路径优先）。"""
+        if not self._pair_index:
+            return None
+        
+        path = self._normalize_path(file_path)
+        while True:
+            pair = self._pair_index.get(path)
+            if pair is not None:
+                return pair
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
     
     def get_notion_workspace_info(self) -> Dict[str, Any]:
         """获取 Notion 工作区信息。"""
@@ -202,19 +227,28 @@ class SyncBridge(QObject, LoggerMixin):
         
         return self.notion_client.load_workspace()
     
+    def load_notion_workspace_async(self):
+        """在后台加载 Notion 工作区信息（预热缓存），不阻塞界面线程。"""
+        if self.notion_client and self.notion_client.connected:
+            self.notion_client.load_workspace_async()
+    
     def create_remote_path_mapping(self, remote_path: str, page_id: str):
         """创建远程路径到页面ID的映射。"""
-        # 这里可以维护一个路径映射表
-        # 暂时存储在配置中
-        mappings = self.config_manager.get("remote_path_mappings", {})
-        mappings[remote_path] = page_id
-        self.config_manager.set("remote_path_mappings", mappings)
+        self._mappings[remote_path] = page_id
+        self.config_manager.set("remote_path_mappings", dict(self._mappings))
         self.logger.info(f"创建路径映射: {remote_path} -> {page_id}")
     
+    def remove_remote_path_mapping(self, remote_path: str) -> bool:
+        """删除远程路径映射，返回映射是否存在。"""
+        if self._mappings.pop(remote_path, None) is None:
+            return False
+        self.config_manager.set("remote_path_mappings", dict(self._mappings))
+        self.logger.info(f"删除路径映射: {remote_path}")
+        return True
+    
     def resolve_remote_path(self, remote_path: str) -> Optional[str]:
         """解析远程路径为页面ID。"""
-        mappings = self.config_manager.get("remote_path_mappings", {})
-        return mappings.get(remote_path)
+        return self._mappings.get(remote_path)
     
     def cleanup(self):
         """清理资源。"""
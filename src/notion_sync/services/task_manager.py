@@ -6,11 +6,30 @@ import json
 import os
 from typing import List, Optional, Dict, Any
 from pathlib import Path
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer
 
 from notion_sync.models.sync_task import SyncTask, TaskStatus
 from notion_sync.utils.config import ConfigManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    _loads = json.loads
+
+
+# 任务变更后延迟写盘的时间（毫秒）；窗口内的多次变更只写一次
+_SAVE_DELAY_MS = 500
+
 
 class TaskManager(QObject):
     """同步任务管理器"""
@@ -25,10 +44,21 @@ class TaskManager(QObject):
         super().__init__()
         self.config_manager = config_manager
         self.tasks: Dict[str, SyncTask] = {}
+        # 状态索引: 状态 -> 任务 ID（dict 作有序集合），随任务增删和状态变更增量维护
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {status: {} for status in TaskStatus}
+        # 每个任务 ID 当前所在的索引桶；任务对象的 status 可能被直接修改，不能据此定位旧桶
+        self._indexed_status: Dict[str, TaskStatus] = {}
         
         # 任务存储文件
         self.tasks_file = Path(config_manager.config_dir) / "sync_tasks.json"
         
+        # 延迟保存：同步过程中频繁的状态更新合并为一次写入
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        
         # 加载已保存的任务
         self._load_tasks()
     
@@ -80,17 +110,35 @@ class TaskManager(QObject):
         
         return task
     
+    def _index_task(self, task: SyncTask):
+        """把任务 ID 放入其当前状态对应的索引桶。"""
+        self._unindex_task(task.task_id)
+        self._by_status[task.status][task.task_id] = None
+        self._indexed_status[task.task_id] = task.status
+    
+    def _unindex_task(self, task_id: str):
+        """把任务 ID 从记录的索引桶中移除。"""
+        old_status = self._indexed_status.pop(task_id, None)
+        if old_status is not None:
+            self._by_status[old_status].pop(task_id, None)
+    
+    def _put_task(self, task: SyncTask):
+        """写入任务并更新状态索引。"""
+        self.tasks[task.task_id] = task
+        self._index_task(task)
+    
     def add_task(self, task: SyncTask):
         """添加任务"""
-        self.tasks[task.task_id] = task
-        self._save_tasks()
+        self._put_task(task)
+        self._schedule_save()
         self.task_added.emit(task)
     
     def remove_task(self, task_id: str) -> bool:
         """删除任务"""
         if task_id in self.tasks:
-            del self.tasks[task_id]
-            self._save_tasks()
+            self.tasks.pop(task_id)
+            self._unindex_task(task_id)
+            self._schedule_save()
             self.task_removed.emit(task_id)
             return True
         return False
@@ -98,8 +146,8 @@ class TaskManager(QObject):
     def update_task(self, task: SyncTask):
         """更新任务"""
         if task.task_id in self.tasks:
-            self.tasks[task.task_id] = task
-            self._save_tasks()
+            self._put_task(task)
+            self._schedule_save()
             self.task_updated.emit(task)
     
     def get_task(self, task_id: str) -> Optional[SyncTask]:
@@ -112,14 +160,15 @@ class TaskManager(QObject):
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[SyncTask]:
         """根据状态获取任务"""
-        return [task for task in self.tasks.values() if task.status == status]
+        return [self.tasks[task_id] for task_id in self._by_status[status]]
     
     def update_task_status(self, task_id: str, status: TaskStatus, error_message: str = ""):
         """更新任务状态"""
         if task_id in self.tasks:
             task = self.tasks[task_id]
             task.update_status(status, error_message)
-            self._save_tasks()
+            self._index_task(task)
+            self._schedule_save()
             self.task_status_changed.emit(task_id, status)
             self.task_updated.emit(task)
     
@@ -141,13 +190,13 @@ class TaskManager(QObject):
             return
         
         try:
-            with open(self.tasks_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.tasks_file, 'rb') as f:
+                data = _loads(f.read())
             
             for task_data in data.get("tasks", []):
                 try:
                     task = SyncTask.from_dict(task_data)
-                    self.tasks[task.task_id] = task
+                    self._put_task(task)
                 except Exception as e:
                     print(f"加载任务失败: {e}")
                     continue
@@ -157,21 +206,34 @@ class TaskManager(QObject):
         except Exception as e:
             print(f"加载任务文件失败: {e}")
     
+    def _schedule_save(self):
+        """标记任务已变更，延迟写盘。"""
+        self._dirty = True
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+    
+    def flush(self):
+        """立即写入尚未保存的变更；应用退出前调用。"""
+        self._save_timer.stop()
+        if self._dirty:
+            self._dirty = False
+            self._save_tasks()
+    
     def _save_tasks(self):
         """保存任务"""
         try:
             # 确保目录存在
             self.tasks_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # 准备数据
-            data = {
-                "version": "1.0",
-                "tasks": [task.to_dict() for task in self.tasks.values()]
-            }
+            # 直接拼接各任务缓存的 to_json 结果，未变更的任务无需重新序列化
+            tasks_json = ",\n".join(task.to_json() for task in self.tasks.values())
+            data = '{\n"version": "1.0",\n"tasks": [\n' + tasks_json + '\n]\n}\n'
             
-            # 保存到文件
-            with open(self.tasks_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 先写临时文件再替换，写入中途崩溃不会损坏已有任务文件
+            tmp_file = self.tasks_file.with_name(self.tasks_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(data.encode("utf-8"))
+            os.replace(tmp_file, self.tasks_file)
             
         except Exception as e:
             print(f"保存任务文件失败: {e}")
@@ -185,8 +247,8 @@ class TaskManager(QObject):
                 "tasks": [task.to_dict() for task in self.tasks.values()]
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_dumps(data))
             
             return True
         except Exception as e:
@@ -196,8 +258,8 @@ class TaskManager(QObject):
     def import_tasks(self, file_path: str) -> bool:
         """导入任务配置"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
             
             imported_count = 0
             for task_data in data.get("tasks", []):
@@ -223,7 +285,10 @@ class TaskManager(QObject):
         """清除所有任务"""
         task_ids = list(self.tasks.keys())
         self.tasks.clear()
-        self._save_tasks()
+        for task_ids_by_status in self._by_status.values():
+            task_ids_by_status.clear()
+        self._indexed_status.clear()
+        self._schedule_save()
         
         for task_id in task_ids:
             self.task_removed.emit(task_id)
@@ -234,7 +299,4 @@ class TaskManager(QObject):
     
     def get_status_summary(self) -> Dict[str, int]:
         """获取状态统计"""
-        summary = {}
-        for status in TaskStatus:
-            summary[status.value] = len(self.get_tasks_by_status(status))
-        return summary
+        return {status.value: len(self._by_status[status]) for status in TaskStatus}
@@ -3,9 +3,11 @@
 """
 
 import asyncio
+import os
 import threading
+from collections import OrderedDict
 from typing import Any, Callable, Optional, Dict
-from PySide6.QtCore import QObject, Signal, QThread, QTimer
+from PySide6.QtCore import QObject, Signal, QTimer, QRunnable, QThreadPool
 from PySide6.QtWidgets import QApplication
 
 
@@ -25,72 +27,111 @@ class AsyncWorker(QObject):
         self.kwargs = kwargs
         self.is_cancelled = False
         
+        # 结束后保留结果，供信号发出后才挂上来的回调使用（见 when_done）
+        self._done_lock = threading.Lock()
+        self.is_done = False
+        self.result = None
+        self.error_message: Optional[str] = None
+        
     def run(self):
         """执行工作"""
         try:
             self.started.emit()
             result = self.func(*self.args, **self.kwargs)
-            if not self.is_cancelled:
-                self.finished.emit(result)
         except Exception as e:
-            if not self.is_cancelled:
-                self.error.emit(str(e))
+            self._finish(None, str(e))
+        else:
+            self._finish(result, None)
+    
+    def _finish(self, result: Any, error_message: Optional[str]):
+        """记录结果并发出完成或错误信号。"""
+        with self._done_lock:
+            self.is_done = True
+            self.result = result
+            self.error_message = error_message
+            if self.is_cancelled:
+                return
+            if error_message is None:
+                self.finished.emit(result)
+            else:
+                self.error.emit(error_message)
+    
+    def when_done(self, on_finished: Callable, on_error: Callable):
+        """连接完成/错误回调；任务已经结束时直接按结果回调"""
+        with self._done_lock:
+            if not self.is_done:
+                self.finished.connect(on_finished)
+                self.error.connect(on_error)
+                return
+        if self.error_message is None:
+            on_finished(self.result)
+        else:
+            on_error(self.error_message)
     
     def cancel(self):
         """取消工作"""
         self.is_cancelled = True
 
 
+class _Runnable(QRunnable):
+    """把 AsyncWorker 包装成可提交到线程池的任务"""
+    
+    def __init__(self, worker: AsyncWorker):
+        super().__init__()
+        self.worker = worker
+    
+    def run(self):
+        self.worker.run()
+
+
+# 共享线程池的并发上限
+_MAX_POOL_THREADS = min(8, os.cpu_count() or 4)
+
+
 class AsyncTaskManager(QObject):
-    """异步任务管理器"""
+    """异步任务管理器 - 任务在共享线程池中执行，线程复用且并发有上限"""
     
     def __init__(self):
         super().__init__()
         self.workers = {}
-        self.threads = {}
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(_MAX_POOL_THREADS)
     
     def run_async(self, task_id: str, func: Callable, *args, **kwargs) -> AsyncWorker:
         """异步运行任务"""
+        worker = self.create_task(task_id, func, *args, **kwargs)
+        self.start_task(worker)
+        return worker
+    
+    def create_task(self, task_id: str, func: Callable, *args, **kwargs) -> AsyncWorker:
+        """创建并登记任务但不启动；调用方连接好信号后再调用 start_task"""
         # 如果任务已存在，先取消
         if task_id in self.workers:
             self.cancel_task(task_id)
         
-        # 创建工作器和线程
+        # 工作器留在创建它的线程，信号经队列连接回到该线程
         worker = AsyncWorker(func, *args, **kwargs)
-        thread = QThread()
-        
-        # 移动工作器到线程
-        worker.moveToThread(thread)
+        worker.finished.connect(lambda _result, w=worker: self._cleanup_task(task_id, w))
+        worker.error.connect(lambda _error, w=worker: self._cleanup_task(task_id, w))
         
-        # 连接信号
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.error.connect(thread.quit)
-        thread.finished.connect(lambda: self._cleanup_task(task_id))
-        
-        # 保存引用
+        # 保存引用，由 start_task 提交到线程池
         self.workers[task_id] = worker
-        self.threads[task_id] = thread
-        
-        # 启动线程
-        thread.start()
-        
         return worker
     
+    def start_task(self, worker: AsyncWorker):
+        """把已创建的任务提交到线程池"""
+        self.pool.start(_Runnable(worker))
+    
     def cancel_task(self, task_id: str):
-        """取消任务"""
-        if task_id in self.workers:
-            self.workers[task_id].cancel()
-            if task_id in self.threads:
-                self.threads[task_id].quit()
-                self.threads[task_id].wait()
+        """取消任务（协作式：已在运行的函数会跑完，但不再发出结果）"""
+        worker = self.workers.pop(task_id, None)
+        if worker is not None:
+            worker.cancel()
     
-    def _cleanup_task(self, task_id: str):
-        """清理任务"""
-        if task_id in self.workers:
+    def _cleanup_task(self, task_id: str, worker: AsyncWorker):
+        """清理任务；同名任务已被新任务替换时保留新任务"""
+        if self.workers.get(task_id) is worker:
             del self.workers[task_id]
-        if task_id in self.threads:
-            del self.threads[task_id]
     
     def cancel_all(self):
         """取消所有任务"""
@@ -189,46 +230,50 @@ class ProgressiveLoader:
         self.loaded_items = []
 
 
+_MISSING = object()
+
+
 class CacheManager:
-    """缓存管理器"""
+    """缓存管理器（LRU）：OrderedDict 的顺序即访问顺序，命中和淘汰都是 O(1)
+    
+    后台加载线程和界面线程会同时读写，所有操作都在锁内完成。
+    """
     
     def __init__(self, max_size: int = 1000):
-        self.cache = {}
-        self.access_order = []
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
         self.max_size = max_size
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """获取缓存"""
-        if key in self.cache:
+        with self._lock:
+            value = self.cache.get(key, _MISSING)
+            if value is _MISSING:
+                return None
             # 更新访问顺序
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]
-        return None
+            self.cache.move_to_end(key)
+            return value
     
     def set(self, key: str, value: Any):
         """设置缓存"""
-        if key in self.cache:
-            # 更新现有缓存
-            self.access_order.remove(key)
-        elif len(self.cache) >= self.max_size:
-            # 移除最久未使用的缓存
-            oldest_key = self.access_order.pop(0)
-            del self.cache[oldest_key]
-        
-        self.cache[key] = value
-        self.access_order.append(key)
+        with self._lock:
+            if key in self.cache:
+                # 更新现有缓存
+                self.cache.move_to_end(key)
+            self.cache[key] = value
+            if len(self.cache) > self.max_size:
+                # 移除最久未使用的缓存
+                self.cache.popitem(last=False)
     
     def clear(self):
         """清除所有缓存"""
-        self.cache.clear()
-        self.access_order.clear()
+        with self._lock:
+            self.cache.clear()
     
     def remove(self, key: str):
         """移除特定缓存"""
-        if key in self.cache:
-            del self.cache[key]
-            self.access_order.remove(key)
+        with self._lock:
+            self.cache.pop(key, None)
 
 
 class SmartFileLoader:
@@ -239,28 +284,45 @@ class SmartFileLoader:
         self.loading_tasks = {}
     
     def load_directory_async(self, path: str, callback: Callable):
-        """异步加载目录"""
-        # 检查缓存
+        """异步加载目录；同一目录的并发请求共用一个正在进行的加载任务"""
+        # 检查缓存：命中时同步回调，不创建线程
         cached_result = self.cache.get(f"dir:{path}")
-        if cached_result:
+        if cached_result is not None:
             callback(cached_result)
             return
         
+        # 已在加载中：挂到现有任务上，避免重复扫描（也避免同名任务被取消重启）；
+        # 任务可能已结束而清理尚未执行，此时 when_done 直接按结果回调
+        worker = self.loading_tasks.get(path)
+        if worker is not None:
+            worker.when_done(callback, lambda error: callback([]))
+            return worker
+        
         # 异步加载
         def load_directory():
             import os
             try:
+                # os.scandir 的目录项自带路径和类型，每个文件只需一次 stat
                 files = []
-                for root, dirs, filenames in os.walk(path):
-                    for filename in filenames:
-                        file_path = os.path.join(root, filename)
-                        file_info = {
-                            'name': filename,
-                            'path': file_path,
-                            'size': os.path.getsize(file_path),
-                            'modified': os.path.getmtime(file_path)
-                        }
-                        files.append(file_info)
+                stack = [path]
+                while stack:
+                    try:
+                        entries = os.scandir(stack.pop())
+                    except OSError:
+                        # 与 os.walk 一致：无法读取的目录直接跳过
+                        continue
+                    with entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                files.append({
+                                    'name': entry.name,
+                                    'path': entry.path,
+                                    'size': stat.st_size,
+                                    'modified': stat.st_mtime
+                                })
                 
                 # 缓存结果
                 self.cache.set(f"dir:{path}", files)
@@ -269,13 +331,16 @@ class SmartFileLoader:
             except Exception as e:
                 raise Exception(f"加载目录失败: {str(e)}")
         
-        # 使用异步任务管理器
-        task_manager = AsyncTaskManager()
-        worker = task_manager.run_async(f"load_dir_{path}", load_directory)
-        
+        # 使用全局异步任务管理器；先连接所有信号并登记，再启动，
+        # 否则很快结束的加载可能在连接之前就发出信号
+        worker = task_manager.create_task(f"load_dir_{path}", load_directory)
+        worker.finished.connect(lambda result: self.loading_tasks.pop(path, None))
+        worker.error.connect(lambda error: self.loading_tasks.pop(path, None))
         worker.finished.connect(callback)
         worker.error.connect(lambda error: callback([]))
+        self.loading_tasks[path] = worker
         
+        task_manager.start_task(worker)
         return worker
 
 
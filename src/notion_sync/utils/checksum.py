@@ -0,0 +1,42 @@
+"""
+内容校验和工具 - 仅用于变更检测。
+"""
+
+import hashlib
+from typing import Any
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# 优先使用 xxh3_128，未安装 xxhash 时回退到 blake2b；两者都是 128 位摘要
+if xxhash is not None:
+    CHECKSUM_ALGORITHM = "xxh3_128"
+
+    def new_checksum_hasher() -> Any:
+        """创建校验和哈希器。"""
+        return xxhash.xxh3_128()
+else:
+    CHECKSUM_ALGORITHM = "blake2b_128"
+
+    def new_checksum_hasher() -> Any:
+        """创建校验和哈希器。"""
+        return hashlib.blake2b(digest_size=16)
+
+
+def fast_hash(data: bytes) -> str:
+    """计算一段数据的校验和。"""
+    hasher = new_checksum_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def file_checksum(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """分块读取并计算文件内容的校验和；读取失败时抛出 OSError。"""
+    hasher = new_checksum_hasher()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
@@ -0,0 +1,24 @@
+"""
+速率限制工具 - 在多线程间共享 Notion API 的请求配额。
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """线程安全的速率限制器：在锁内分配时间槽，在锁外等待。"""
+    
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def acquire(self) -> None:
+        """阻塞直到允许下一次调用。"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
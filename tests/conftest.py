@@ -0,0 +1,21 @@
+"""
+测试公共配置
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 未安装包时直接从 src 导入
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture(scope="session")
+def qt_core_app():
+    """提供 QCoreApplication，QTimer 等对象需要它。"""
+    QtCore = pytest.importorskip("PySide6.QtCore")
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    yield app
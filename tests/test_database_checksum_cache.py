@@ -0,0 +1,49 @@
+"""
+DatabaseManager 校验和缓存测试
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from notion_sync.models.database import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """使用临时 SQLite 文件的数据库管理器。"""
+    monkeypatch.setattr(DatabaseManager, "_get_database_path", lambda self: tmp_path / "test.db")
+    return DatabaseManager()
+
+
+def test_notion_checksums_round_trip_and_update(db):
+    assert db.save_notion_checksums({"page-1": ("2024-01-01T00:00:00Z", "aaa")}, "xxh3")
+    assert db.save_notion_checksums({"page-1": ("2024-01-02T00:00:00Z", "bbb"),
+                                     "page-2": ("2024-01-01T00:00:00Z", "ccc")}, "xxh3")
+    
+    assert db.get_notion_checksums("xxh3") == {
+        "page-1": ("2024-01-02T00:00:00Z", "bbb"),
+        "page-2": ("2024-01-01T00:00:00Z", "ccc"),
+    }
+
+
+def test_checksums_are_scoped_by_algorithm(db):
+    db.save_notion_checksums({"page-1": ("t", "aaa")}, "sha256")
+    db.save_local_checksums({"/tmp/a.md": (1, 2, "aaa")}, "sha256")
+    
+    assert db.get_notion_checksums("xxh3") == {}
+    assert db.get_local_checksums("xxh3") == {}
+
+
+def test_delete_notion_checksums(db):
+    db.save_notion_checksums({"page-1": ("t", "a"), "page-2": ("t", "b")}, "xxh3")
+    
+    assert db.delete_notion_checksums(["page-1"])
+    assert db.get_notion_checksums("xxh3") == {"page-2": ("t", "b")}
+
+
+def test_local_checksums_keep_large_mtime_ns(db):
+    mtime_ns = 1_700_000_000_123_456_789
+    db.save_local_checksums({"/tmp/a.md": (mtime_ns, 42, "abc")}, "xxh3")
+    
+    assert db.get_local_checksums("xxh3") == {"/tmp/a.md": (mtime_ns, 42, "abc")}
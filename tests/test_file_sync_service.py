@@ -0,0 +1,44 @@
+"""
+文件同步服务时间比较测试
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from notion_sync.services.file_sync_service import _datetime_to_ns
+
+
+def test_aware_datetime_is_exact():
+    value = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    
+    expected = int(value.timestamp()) * 1_000_000_000 + 678_901_000
+    assert _datetime_to_ns(value) == expected
+
+
+def test_naive_datetime_is_local_time(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("x")
+    mtime_ns = os.stat(path).st_mtime_ns
+    
+    local = datetime.fromtimestamp(mtime_ns / 1e9)
+    
+    # 微秒精度：与 st_mtime_ns 相差不超过 1 微秒
+    assert abs(_datetime_to_ns(local) - mtime_ns) <= 1000
+
+
+def test_equal_instants_in_different_zones_compare_equal():
+    utc = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+    shifted = utc.astimezone(timezone(timedelta(hours=8)))
+    
+    assert _datetime_to_ns(utc) == _datetime_to_ns(shifted)
+
+
+def test_ordering_is_preserved():
+    earlier = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+    later = earlier + timedelta(microseconds=1)
+    
+    assert _datetime_to_ns(earlier) < _datetime_to_ns(later)
@@ -0,0 +1,99 @@
+"""
+NotionClient 请求重试与退避测试
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("aiohttp")
+pytest.importorskip("asyncio_throttle")
+
+from notion_sync.models import notion_client as nc_module
+from notion_sync.models.notion_client import NotionAPIError, NotionClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """已认证、无真实网络与等待的客户端。"""
+    auth = SimpleNamespace(is_authenticated=True, is_token_expired=lambda: False)
+    client = NotionClient(auth)
+    
+    sleeps = []
+    
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+    
+    monkeypatch.setattr(nc_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(nc_module.random, "uniform", lambda a, b: 0.0)
+    client.sleeps = sleeps
+    return client
+
+
+def _responses(client, monkeypatch, outcomes):
+    """让 _send_request 依次返回/抛出给定结果，返回调用计数列表。"""
+    calls = []
+    
+    async def fake_send(method, endpoint, data=None, params=None):
+        outcome = outcomes[len(calls)]
+        calls.append((method, endpoint))
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    monkeypatch.setattr(client, "_send_request", fake_send)
+    return calls
+
+
+def test_transient_errors_are_retried_with_exponential_backoff(client, monkeypatch):
+    calls = _responses(client, monkeypatch, [
+        NotionAPIError("rate limited", 429),
+        NotionAPIError("bad gateway", 502),
+        {"ok": True},
+    ])
+    
+    result = asyncio.run(client._make_request("GET", "/users"))
+    
+    assert result == {"ok": True}
+    assert len(calls) == 3
+    assert client.sleeps == [0.5, 1.0]
+
+
+def test_backoff_is_capped(client, monkeypatch):
+    client.retry_attempts = 6
+    _responses(client, monkeypatch, [NotionAPIError("busy", 503)] * 6 + [{}])
+    
+    asyncio.run(client._make_request("GET", "/users"))
+    
+    assert client.sleeps == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+
+def test_gives_up_after_retry_attempts(client, monkeypatch):
+    calls = _responses(client, monkeypatch, [NotionAPIError("busy", 503)] * 4)
+    
+    with pytest.raises(NotionAPIError):
+        asyncio.run(client._make_request("GET", "/users"))
+    
+    assert len(calls) == client.retry_attempts + 1
+
+
+def test_non_retryable_errors_raise_immediately(client, monkeypatch):
+    calls = _responses(client, monkeypatch, [NotionAPIError("not found", 404)])
+    
+    with pytest.raises(NotionAPIError):
+        asyncio.run(client._make_request("GET", "/pages/x"))
+    
+    assert len(calls) == 1
+    assert client.sleeps == []
+
+
+def test_inflight_semaphore_is_recreated_for_each_loop(client):
+    async def get_sem():
+        return client._get_inflight_semaphore()
+    
+    first = asyncio.run(get_sem())
+    second = asyncio.run(get_sem())
+    
+    assert first is not second
@@ -0,0 +1,53 @@
+"""
+SyncBridge 同步对路径索引测试
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("requests")
+
+from notion_sync.services.sync_bridge import SyncBridge
+
+
+def _bridge(*local_paths):
+    """只带同步对索引的桥接器，不创建文件监控和同步服务。"""
+    pairs = [SimpleNamespace(local_path=path) for path in local_paths]
+    bridge = SyncBridge.__new__(SyncBridge)
+    bridge.file_sync_service = SimpleNamespace(get_sync_pairs=lambda: pairs)
+    bridge._rebuild_pair_index()
+    return bridge, pairs
+
+
+def test_file_inside_root_matches_pair():
+    bridge, (pair,) = _bridge(os.path.join("/data", "notes"))
+    
+    assert bridge._find_sync_pair(os.path.join("/data", "notes", "a", "b.md")) is pair
+
+
+def test_sibling_with_common_prefix_does_not_match():
+    bridge, _ = _bridge(os.path.join("/data", "repo"))
+    
+    assert bridge._find_sync_pair(os.path.join("/data", "repo2", "a.md")) is None
+
+
+def test_deepest_root_wins():
+    bridge, (outer, inner) = _bridge(os.path.join("/data"), os.path.join("/data", "inner"))
+    
+    assert bridge._find_sync_pair(os.path.join("/data", "inner", "a.md")) is inner
+    assert bridge._find_sync_pair(os.path.join("/data", "other", "a.md")) is outer
+
+
+def test_paths_are_normalized():
+    bridge, (pair,) = _bridge("/data/notes/")
+    
+    assert bridge._find_sync_pair("/data//notes/./a.md") is pair
+
+
+def test_no_pairs():
+    bridge, _ = _bridge()
+    
+    assert bridge._find_sync_pair("/data/a.md") is None
@@ -0,0 +1,75 @@
+"""
+TaskManager 延迟保存与原子写入测试
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from notion_sync.models.sync_task import TaskStatus
+from notion_sync.services.task_manager import TaskManager
+
+
+@pytest.fixture
+def manager(tmp_path, qt_core_app):
+    return TaskManager(SimpleNamespace(config_dir=str(tmp_path)))
+
+
+def _create(manager, name="任务"):
+    return manager.create_task(name, "page", "page-id", "页面", "/tmp/notion")
+
+
+def test_changes_are_deferred_until_flush(manager):
+    _create(manager)
+    
+    assert manager._dirty
+    assert not manager.tasks_file.exists()
+    
+    manager.flush()
+    
+    assert not manager._dirty
+    assert manager.tasks_file.exists()
+
+
+def test_flush_without_changes_does_not_write(manager):
+    manager.flush()
+    
+    assert not manager.tasks_file.exists()
+
+
+def test_save_is_atomic_and_round_trips(manager, tmp_path):
+    first = _create(manager, "一")
+    second = _create(manager, "二")
+    manager.update_task_status(second.task_id, TaskStatus.FAILED, "出错")
+    manager.flush()
+    
+    assert not list(tmp_path.glob("*.tmp"))
+    data = json.loads(manager.tasks_file.read_text(encoding="utf-8"))
+    assert data["version"] == "1.0"
+    assert [task["task_id"] for task in data["tasks"]] == [first.task_id, second.task_id]
+    
+    reloaded = TaskManager(SimpleNamespace(config_dir=str(tmp_path)))
+    assert reloaded.get_task(second.task_id).status == TaskStatus.FAILED
+    assert reloaded.get_task(second.task_id).error_message == "出错"
+
+
+def test_saved_file_reflects_changes_after_cached_serialization(manager, tmp_path):
+    task = _create(manager)
+    manager.flush()
+    
+    manager.update_task_status(task.task_id, TaskStatus.COMPLETED)
+    manager.flush()
+    
+    reloaded = TaskManager(SimpleNamespace(config_dir=str(tmp_path)))
+    assert reloaded.get_task(task.task_id).status == TaskStatus.COMPLETED
+
+
+def test_status_index_tracks_updates(manager):
+    task = _create(manager)
+    manager.update_task_status(task.task_id, TaskStatus.RUNNING)
+    
+    assert manager.get_tasks_by_status(TaskStatus.RUNNING) == [task]
+    assert manager.get_tasks_by_status(TaskStatus.CREATED) == []
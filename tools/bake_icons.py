@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+预渲染图标脚本 - 把 icons 模块绘制的图标保存为 PNG 数据
+
+生成 src/notion_sync/resources/_baked_icons.py，运行时直接加载 PNG，
+不再在启动时用 QPainter 绘制。该文件是构建产物，不纳入版本库；
+make build 会先执行此脚本，也可以单独运行:
+
+    make icons
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from PySide6.QtCore import QBuffer, QIODevice
+from PySide6.QtWidgets import QApplication
+
+from notion_sync.resources import icons
+
+OUTPUT = ROOT / "src" / "notion_sync" / "resources" / "_baked_icons.py"
+
+
+def bake() -> dict:
+    """绘制所有自定义图标并返回 {名称: PNG 字节}。"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    icons._pixel_ratio = icons._BAKED_PIXEL_RATIO
+
+    baked = {}
+    for name in icons._ICON_SPECS:
+        image = icons._create_icon_image(name)
+
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        baked[name] = bytes(buffer.data())
+        buffer.close()
+
+    return baked
+
+
+def main() -> int:
+    baked = bake()
+    lines = [
+        '"""',
+        "预渲染的图标 PNG 数据 - 由 tools/bake_icons.py 生成，请勿手动修改",
+        '"""',
+        "",
+        "ICON_BYTES = {",
+    ]
+    for name, data in sorted(baked.items()):
+        lines.append(f"    {name!r}: {data!r},")
+    lines.append("}")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"已写入 {len(baked)} 个图标到 {OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())